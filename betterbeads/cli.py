@@ -1,13 +1,28 @@
 """CLI interface for ght."""
 
 import functools
+import hashlib
 import json
+import os
+import re
 import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import click
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson parses bytes directly, skipping the decode pass json.load does;
+# hooks use this on every session event so the difference is user-visible
+_loads = orjson.loads if orjson else json.loads
+
 from . import history
 from .gh import GhClient, GhError
 from .models import (
@@ -27,7 +42,15 @@ from .models import (
     User,
 )
 from .config import get_config
-from .parser import add_dependencies, parse_dependencies, remove_dependencies, set_task_complete
+from .parser import (
+    TaskIndex,
+    add_dependencies,
+    append_to_section,
+    parse_dependencies,
+    remove_dependencies,
+    replace_section_content,
+    set_task_complete,
+)
 from .project import ProjectResolver
 
 
@@ -67,93 +90,163 @@ def with_repo_option(f: Any) -> Any:
     return wrapper
 
 
+# Pattern to match closing keywords in PR bodies ("closes #123", "fixes #456", etc.)
+_CLOSES_PATTERN = re.compile(
+    r"(?:close[sd]?|fix(?:e[sd])?|resolve[sd]?)\s+#(\d+)",
+    re.IGNORECASE,
+)
+
+
 def output_json(data: Any) -> None:
     """Output data as formatted JSON."""
-    click.echo(json.dumps(data, indent=2))
+    if orjson is not None:
+        # orjson serializes several times faster than the stdlib; it's an
+        # optional dependency so fall through when it's not installed
+        sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
+        return
+    # Serialize directly to the stream instead of materializing the whole
+    # document as a string first (trees and list views can be large)
+    stream = click.get_text_stream("stdout")
+    json.dump(data, stream, indent=2)
+    stream.write("\n")
+    stream.flush()
+
+
+@functools.lru_cache(maxsize=4)
+def _lower_label_set(labels: tuple[str, ...]) -> frozenset[str]:
+    """Lowercase a label tuple into a frozenset (cached per config)."""
+    return frozenset(label.lower() for label in labels)
+
+
+def _blocked_labels() -> frozenset[str]:
+    """Get the configured blocked-indicator labels, lowercased.
+
+    The set is derived from config once and cached, so hot paths
+    (tree walks, list parsing) don't rebuild it per call.
+    """
+    return _lower_label_set(tuple(get_config().blocked_indicators.labels))
+
+
+def _lower_label_names(items: list[Any]) -> list[str]:
+    """Lowercase label names from dicts or plain strings.
+
+    Like _extract_names, the shape is checked once per list rather than
+    per element.
+    """
+    if not items:
+        return []
+    if isinstance(items[0], dict):
+        return [item.get("name", "").lower() for item in items]
+    return [item.lower() for item in items]
 
 
 def build_dependency_tree(
     number: int,
     client: GhClient,
     repo: str,
-    visited: set[tuple[str, int]] | None = None,
-    depth: int = 0,
     max_depth: int = 5,
 ) -> dict[str, Any]:
     """Build a dependency tree for an issue.
 
+    Walks the tree breadth-first and fetches each level with a single
+    batched GraphQL query per repo, instead of one `gh issue view`
+    round-trip per node.
+
     Args:
         number: Issue number
         client: GhClient for fetching data
         repo: Repository in owner/repo format
-        visited: Set of already visited (repo, number) tuples to prevent cycles
-        depth: Current recursion depth
-        max_depth: Maximum recursion depth
+        max_depth: Maximum tree depth
 
     Returns:
         Tree structure with issue info and nested dependencies
     """
-    if visited is None:
-        visited = set()
-
-    # Prevent cycles and limit depth
-    key = (repo, number)
-    if key in visited or depth > max_depth:
-        return {
-            "number": number,
-            "repo": repo,
-            "cycle": key in visited,
-            "truncated": depth > max_depth,
-        }
-
-    visited.add(key)
-
-    try:
-        data = client.issue_view(number, repo=repo)
-        body = data.get("body", "") or ""
-        deps_raw = parse_dependencies(body)
-
-        # Get config for blocked labels
-        config = get_config()
-        blocked_labels = {label.lower() for label in config.blocked_indicators.labels}
-
-        labels = [
-            (label.get("name", "") if isinstance(label, dict) else label).lower()
-            for label in data.get("labels", [])
-        ]
-        is_blocked = any(label in blocked_labels for label in labels)
-
-        node = {
-            "number": number,
-            "repo": repo,
-            "title": data.get("title", ""),
-            "state": data.get("state", "").lower(),
-            "blocked": is_blocked,
-            "dependencies": [],
-        }
+    blocked_labels = _blocked_labels()
+
+    root: dict[str, Any] = {"number": number, "repo": repo}
+    root_key = (repo, number)
+    visited: set[tuple[str, int]] = {root_key}
+    # Each frontier entry carries the set of keys on its path from the root,
+    # so back-edges (cycles) can be told apart from diamond-shaped repeats.
+    frontier: list[tuple[str, int, dict[str, Any], frozenset[tuple[str, int]]]] = [
+        (repo, number, root, frozenset({root_key}))
+    ]
+    depth = 0
+
+    while frontier:
+        # Group this level by repo and fetch each group in one query
+        by_repo: dict[str, list[tuple[int, dict[str, Any]]]] = {}
+        for node_repo, node_number, node, _ in frontier:
+            by_repo.setdefault(node_repo, []).append((node_number, node))
+
+        def _fetch_repo(node_repo: str) -> dict[int, dict[str, Any]]:
+            try:
+                return client.issues_view_batch(
+                    [n for n, _ in by_repo[node_repo]], repo=node_repo
+                )
+            except GhError:
+                return {}
+
+        # Fetch repo groups concurrently; each batch is an independent
+        # I/O-bound gh call, capped at 10 workers for rate-limit headroom
+        fetched: dict[tuple[str, int], dict[str, Any]] = {}
+        if len(by_repo) > 1:
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                batches = dict(zip(by_repo, executor.map(_fetch_repo, by_repo)))
+        else:
+            batches = {node_repo: _fetch_repo(node_repo) for node_repo in by_repo}
+        for node_repo, entries in by_repo.items():
+            batch = batches[node_repo]
+            for n, _ in entries:
+                if n in batch:
+                    fetched[(node_repo, n)] = batch[n]
+
+        next_frontier: list[tuple[str, int, dict[str, Any], frozenset[tuple[str, int]]]] = []
+        for node_repo, node_number, node, ancestors in frontier:
+            data = fetched.get((node_repo, node_number))
+            if data is None:
+                node["error"] = "Failed to fetch"
+                continue
 
-        # Recursively build tree for dependencies
-        for dep in deps_raw:
-            dep_repo = dep.repo or repo
-            child = build_dependency_tree(
-                dep.number,
-                client,
-                dep_repo,
-                visited.copy(),  # Copy to allow parallel branches
-                depth + 1,
-                max_depth,
-            )
-            child["complete"] = dep.complete
-            node["dependencies"].append(child)
+            body = data.get("body", "") or ""
+            deps_raw = parse_dependencies(body)
+
+            labels = _lower_label_names(data.get("labels", []))
+            is_blocked = not blocked_labels.isdisjoint(labels)
+
+            node["title"] = data.get("title", "")
+            node["state"] = data.get("state", "").lower()
+            node["blocked"] = is_blocked
+            node["dependencies"] = []
+
+            for dep in deps_raw:
+                dep_repo = dep.repo or node_repo
+                key = (dep_repo, dep.number)
+                child: dict[str, Any] = {"number": dep.number, "repo": dep_repo}
+                if key in ancestors:
+                    child["cycle"] = True
+                    child["truncated"] = False
+                elif key in visited:
+                    # Already expanded (or queued) elsewhere in the tree;
+                    # emit a stub instead of refetching the shared subtree
+                    child["duplicate"] = True
+                elif depth + 1 > max_depth:
+                    child["cycle"] = False
+                    child["truncated"] = True
+                else:
+                    visited.add(key)
+                    next_frontier.append(
+                        (dep_repo, dep.number, child, ancestors | {key})
+                    )
+                child["complete"] = dep.complete
+                node["dependencies"].append(child)
 
-        return node
+        frontier = next_frontier
+        depth += 1
 
-    except GhError:
-        return {
-            "number": number,
-            "repo": repo,
-            "error": "Failed to fetch",
-        }
+    return root
 
 
 def enrich_dependencies(
@@ -171,48 +264,101 @@ def enrich_dependencies(
     Returns:
         List of enriched Dependency objects
     """
-    config = get_config()
-    blocked_labels = {label.lower() for label in config.blocked_indicators.labels}
+    blocked_labels = _blocked_labels()
 
-    enriched = []
+    # Group by repo and fetch each group with one batched GraphQL query
+    # instead of one issue_view call per dependency
+    by_repo: dict[str, list[int]] = {}
     for dep in dependencies:
-        # Determine which repo to fetch from
-        dep_repo = dep.repo or current_repo
+        by_repo.setdefault(dep.repo or current_repo, []).append(dep.number)
 
+    def _fetch_repo(dep_repo: str) -> dict[int, dict[str, Any]]:
         try:
-            # Fetch the dependency issue
-            dep_data = client.issue_view(dep.number, repo=dep_repo)
-
-            # Extract title and state
-            title = dep_data.get("title", "")
-            state = dep_data.get("state", "").lower()
-
-            # Check if dependency is blocked
-            dep_labels = [
-                (label.get("name", "") if isinstance(label, dict) else label).lower()
-                for label in dep_data.get("labels", [])
-            ]
-            is_blocked = any(label in blocked_labels for label in dep_labels)
-
-            enriched.append(Dependency(
-                number=dep.number,
-                repo=dep.repo,
-                complete=dep.complete,
-                title=title,
-                state=state,
-                blocked=is_blocked,
-            ))
+            return client.issues_view_batch(by_repo[dep_repo], repo=dep_repo)
         except GhError:
+            return {}
+
+    if len(by_repo) > 1:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            batches = dict(zip(by_repo, executor.map(_fetch_repo, by_repo)))
+    else:
+        batches = {dep_repo: _fetch_repo(dep_repo) for dep_repo in by_repo}
+
+    enriched = []
+    for dep in dependencies:
+        dep_data = batches[dep.repo or current_repo].get(dep.number)
+        if dep_data is None:
             # If fetch fails, keep original without enrichment
             enriched.append(dep)
+            continue
+
+        # Extract title and state
+        title = dep_data.get("title", "")
+        state = dep_data.get("state", "").lower()
+
+        # Check if dependency is blocked
+        dep_labels = _lower_label_names(dep_data.get("labels", []))
+        is_blocked = not blocked_labels.isdisjoint(dep_labels)
+
+        enriched.append(Dependency(
+            number=dep.number,
+            repo=dep.repo,
+            complete=dep.complete,
+            title=title,
+            state=state,
+            blocked=is_blocked,
+        ))
 
     return enriched
 
 
+# Shared sentinel for issues/PRs without author data, so the common
+# empty case skips a per-item allocation
+_UNKNOWN_USER = User(login="unknown")
+
+
+def _parse_user(author_data: dict[str, Any] | None) -> User:
+    """Parse author data into a User, sharing the unknown sentinel."""
+    if not author_data:
+        return _UNKNOWN_USER
+    return User(
+        login=author_data.get("login", "unknown"),
+        name=author_data.get("name"),
+    )
+
+
+def _split_csv(value: str | None) -> list[str] | None:
+    """Split a comma-separated option value into stripped items.
+
+    Returns None for empty/absent values, matching how the optional CSV
+    options are passed through to the client.
+    """
+    if not value:
+        return None
+    return [item.strip() for item in value.split(",")]
+
+
+def _extract_names(items: list[Any], key: str) -> list[str]:
+    """Extract names from a list of dicts or plain strings.
+
+    gh returns labels/assignees either as objects or bare strings depending
+    on the endpoint; check the shape once instead of per element.
+    """
+    if not items:
+        return []
+    if isinstance(items[0], dict):
+        return [item.get(key, "") for item in items]
+    return list(items)
+
+
+@functools.lru_cache(maxsize=8)
 def get_client(token: str | None, repo: str | None) -> GhClient:
-    """Create a GhClient instance."""
-    import os
+    """Create a GhClient instance.
 
+    Cached per (token, repo) so repeated calls in one process (hooks,
+    batch paths) reuse the client and its instance-level caches instead
+    of re-running the gh install check.
+    """
     token = token or os.environ.get("GHT_TOKEN")
     return GhClient(token=token, repo=repo)
 
@@ -220,11 +366,7 @@ def get_client(token: str | None, repo: str | None) -> GhClient:
 def parse_issue_data(data: dict[str, Any], repo: str) -> Issue:
     """Parse gh issue data into Issue model."""
     # Parse author
-    author_data = data.get("author") or {}
-    author = User(
-        login=author_data.get("login", "unknown"),
-        name=author_data.get("name"),
-    )
+    author = _parse_user(data.get("author"))
 
     # Parse milestone
     milestone = None
@@ -235,29 +377,21 @@ def parse_issue_data(data: dict[str, Any], repo: str) -> Issue:
         )
 
     # Parse labels
-    labels = [
-        label.get("name", "") if isinstance(label, dict) else label
-        for label in data.get("labels", [])
-    ]
+    labels = _extract_names(data.get("labels", []), "name")
 
     # Parse assignees
-    assignees = [
-        a.get("login", "") if isinstance(a, dict) else a
-        for a in data.get("assignees", [])
-    ]
+    assignees = _extract_names(data.get("assignees", []), "login")
 
     # Parse comments
-    comments = []
-    for c in data.get("comments", []):
-        author_info = c.get("author") or {}
-        comments.append(
-            Comment(
-                id=c.get("id", 0),
-                author=author_info.get("login", "unknown"),
-                body=c.get("body", ""),
-                created_at=c.get("createdAt", ""),
-            )
+    comments = [
+        Comment(
+            id=c.get("id", 0),
+            author=(c.get("author") or {}).get("login", "unknown"),
+            body=c.get("body", ""),
+            created_at=c.get("createdAt", ""),
         )
+        for c in data.get("comments", [])
+    ]
 
     # Parse dependencies from body
     body = data.get("body", "") or ""
@@ -272,21 +406,19 @@ def parse_issue_data(data: dict[str, Any], repo: str) -> Issue:
     ]
 
     # Parse project items
-    project_items = []
-    for item in data.get("projectItems", []):
-        project_items.append(
-            ProjectItem(
-                project=item.get("title", "Unknown"),
-                status=item.get("status", {}).get("name") if item.get("status") else None,
-                fields={},  # Could parse additional fields here
-            )
+    project_items = [
+        ProjectItem(
+            project=item.get("title", "Unknown"),
+            status=item.get("status", {}).get("name") if item.get("status") else None,
+            fields={},  # Could parse additional fields here
         )
+        for item in data.get("projectItems", [])
+    ]
 
     # Calculate blocked status
     blocked = BlockedStatus()
-    config = get_config()
-    blocked_labels = {label.lower() for label in config.blocked_indicators.labels}
-    if any(label.lower() in blocked_labels for label in labels):
+    blocked_labels = _blocked_labels()
+    if not blocked_labels.isdisjoint(label.lower() for label in labels):
         blocked.directly = True
         blocked.reasons.append("has blocked label")
 
@@ -329,14 +461,57 @@ def parse_issue_data(data: dict[str, Any], repo: str) -> Issue:
     )
 
 
+def parse_issue_data_lite(data: dict[str, Any], repo: str) -> Issue:
+    """Parse gh issue data into an Issue with only hook-needed fields.
+
+    Populates number, title, labels, assignees, state, and the
+    ready/blocked computation; skips author, milestone, comment, and
+    project-item parsing that hook output never reads.
+    """
+    labels = _extract_names(data.get("labels", []), "name")
+    assignees = _extract_names(data.get("assignees", []), "login")
+    body = data.get("body", "") or ""
+
+    blocked = BlockedStatus()
+    blocked_labels = _blocked_labels()
+    if not blocked_labels.isdisjoint(label.lower() for label in labels):
+        blocked.directly = True
+        blocked.reasons.append("has blocked label")
+
+    incomplete_deps = [d for d in parse_dependencies(body) if not d.complete]
+    if incomplete_deps:
+        blocked.by_dependencies = True
+        for d in incomplete_deps:
+            ref = f"{d.repo}#{d.number}" if d.repo else f"#{d.number}"
+            blocked.reasons.append(f"dependency {ref} is incomplete")
+
+    state = data.get("state", "").upper()
+    ready = (
+        state == "OPEN"
+        and not blocked.directly
+        and not blocked.by_dependencies
+    )
+
+    return Issue(
+        number=data.get("number", 0),
+        url=data.get("url", ""),
+        title=data.get("title", ""),
+        body=body,
+        state=state.lower(),
+        author=_UNKNOWN_USER,
+        created_at="",
+        updated_at="",
+        labels=labels,
+        assignees=assignees,
+        blocked=blocked,
+        ready=ready,
+    )
+
+
 def parse_pr_data(data: dict[str, Any], repo: str, checks: list[dict] | None = None) -> PR:
     """Parse gh PR data into PR model."""
     # Parse author
-    author_data = data.get("author") or {}
-    author = User(
-        login=author_data.get("login", "unknown"),
-        name=author_data.get("name"),
-    )
+    author = _parse_user(data.get("author"))
 
     # Parse milestone
     milestone = None
@@ -347,58 +522,48 @@ def parse_pr_data(data: dict[str, Any], repo: str, checks: list[dict] | None = N
         )
 
     # Parse labels
-    labels = [
-        label.get("name", "") if isinstance(label, dict) else label
-        for label in data.get("labels", [])
-    ]
+    labels = _extract_names(data.get("labels", []), "name")
 
     # Parse assignees
-    assignees = [
-        a.get("login", "") if isinstance(a, dict) else a
-        for a in data.get("assignees", [])
-    ]
+    assignees = _extract_names(data.get("assignees", []), "login")
 
-    # Parse reviewers from reviewRequests
-    reviewers = []
-    for req in data.get("reviewRequests", []):
-        if req.get("login"):
-            reviewers.append(req.get("login"))
-        elif req.get("name"):
-            reviewers.append(req.get("name"))
+    # Parse reviewers from reviewRequests (users have a login, teams a name)
+    reviewers = [
+        name
+        for req in data.get("reviewRequests", [])
+        if (name := req.get("login") or req.get("name"))
+    ]
 
     # Parse reviews
-    reviews = []
-    for r in data.get("reviews", []):
-        author_info = r.get("author") or {}
-        reviews.append(
-            Review(
-                author=author_info.get("login", "unknown"),
-                state=r.get("state", ""),
-                body=r.get("body"),
-                submitted_at=r.get("submittedAt", ""),
-            )
+    reviews = [
+        Review(
+            author=(r.get("author") or {}).get("login", "unknown"),
+            state=r.get("state", ""),
+            body=r.get("body"),
+            submitted_at=r.get("submittedAt", ""),
         )
+        for r in data.get("reviews", [])
+    ]
 
     # Parse comments
-    comments = []
-    for c in data.get("comments", []):
-        author_info = c.get("author") or {}
-        comments.append(
-            Comment(
-                id=c.get("id", 0),
-                author=author_info.get("login", "unknown"),
-                body=c.get("body", ""),
-                created_at=c.get("createdAt", ""),
-            )
+    comments = [
+        Comment(
+            id=c.get("id", 0),
+            author=(c.get("author") or {}).get("login", "unknown"),
+            body=c.get("body", ""),
+            created_at=c.get("createdAt", ""),
         )
+        for c in data.get("comments", [])
+    ]
 
     # Parse checks
     check_status = CheckStatus(status="unknown")
     if checks:
         items = []
+        # Severity per check: failure outranks pending outranks success;
+        # anything else keeps the aggregate at unknown
+        worst = 0
         all_success = True
-        any_failure = False
-        any_pending = False
         for c in checks:
             status = c.get("state", "").lower()
             conclusion = c.get("conclusion")
@@ -410,18 +575,26 @@ def parse_pr_data(data: dict[str, Any], repo: str, checks: list[dict] | None = N
                     url=c.get("detailsUrl"),
                 )
             )
+            if worst == 3:
+                # A failure already decides the aggregate; the remaining
+                # checks only need their items built
+                continue
             if status == "pending" or status == "in_progress":
-                any_pending = True
-                all_success = False
+                weight = 2
             elif status == "failure" or conclusion == "failure":
-                any_failure = True
-                all_success = False
-            elif status != "success" and conclusion != "success":
+                weight = 3
+            elif status == "success" or conclusion == "success":
+                weight = 1
+            else:
+                weight = 0
+            if weight > worst:
+                worst = weight
+            if weight != 1:
                 all_success = False
 
-        if any_failure:
+        if worst == 3:
             check_status = CheckStatus(status="failure", items=items)
-        elif any_pending:
+        elif worst == 2:
             check_status = CheckStatus(status="pending", items=items)
         elif all_success and items:
             check_status = CheckStatus(status="success", items=items)
@@ -436,26 +609,18 @@ def parse_pr_data(data: dict[str, Any], repo: str, checks: list[dict] | None = N
     )
 
     # Parse project items
-    project_items = []
-    for item in data.get("projectItems", []):
-        project_items.append(
-            ProjectItem(
-                project=item.get("title", "Unknown"),
-                status=item.get("status", {}).get("name") if item.get("status") else None,
-                fields={},
-            )
+    project_items = [
+        ProjectItem(
+            project=item.get("title", "Unknown"),
+            status=item.get("status", {}).get("name") if item.get("status") else None,
+            fields={},
         )
+        for item in data.get("projectItems", [])
+    ]
 
     # Parse closes issues from body (looks for "closes #123", "fixes #456", etc.)
-    import re
-    closes_issues = []
     body = data.get("body", "") or ""
-    close_patterns = re.findall(
-        r"(?:close[sd]?|fix(?:e[sd])?|resolve[sd]?)\s+#(\d+)",
-        body,
-        re.IGNORECASE,
-    )
-    closes_issues = [int(n) for n in close_patterns]
+    closes_issues = [int(n) for n in _CLOSES_PATTERN.findall(body)]
 
     return PR(
         number=data.get("number", 0),
@@ -483,6 +648,43 @@ def parse_pr_data(data: dict[str, Any], repo: str, checks: list[dict] | None = N
     )
 
 
+def _fetch_pr_diff(
+    client: "GhClient",
+    number: int,
+    repo: str | None,
+    target_repo: str,
+    head_sha: str | None,
+) -> str | None:
+    """Fetch a PR diff, serving repeats from a head-SHA-keyed disk cache.
+
+    Diffs are immutable for a given head commit, so the cache never needs
+    explicit invalidation — new pushes change the SHA and miss naturally.
+    """
+    cache_path = None
+    if head_sha:
+        key = hashlib.sha1(f"{target_repo}:{number}:{head_sha}".encode()).hexdigest()
+        cache_path = Path.home() / ".cache" / "betterbeads" / "diffs" / key
+        try:
+            return cache_path.read_text()
+        except OSError:
+            pass
+
+    diff_result = client.run(["pr", "diff", str(number)], repo=repo, check=False)
+    if not diff_result.success:
+        return None
+
+    if cache_path is not None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+            tmp_path.write_text(diff_result.stdout)
+            tmp_path.replace(cache_path)
+        except OSError:
+            pass  # Caching is best-effort
+
+    return diff_result.stdout
+
+
 def _auto_check_referencing_issues(
     client: "GhClient",
     closed_number: int,
@@ -507,6 +709,11 @@ def _auto_check_referencing_issues(
     """
     result: dict[str, Any] = {"updated": [], "errors": []}
 
+    # Matches an unchecked same-repo task item for the closed issue; bodies
+    # that don't match (already checked, or only mention the number in
+    # prose) skip the full task-list rewrite
+    needs_check = re.compile(rf"^- \[ \] #{closed_number}(?!\d)", re.MULTILINE)
+
     # Search for open issues that might reference this one
     try:
         matches = client.search_issues(f"#{closed_number} in:body is:open", repo=repo)
@@ -514,36 +721,57 @@ def _auto_check_referencing_issues(
         result["errors"].append(f"Search failed: {e}")
         return result
 
+    # Cheap local pass first: collect the (number, new_body) pairs that
+    # actually need an edit
+    candidates: list[tuple[int, str]] = []
     for match in matches:
         match_number = match["number"]
         if match_number == closed_number:
             continue  # Skip self
 
+        # Search results carry the body, so skip the per-match view call
+        old_body = match.get("body", "") or ""
+
+        # Cheap guards: skip the task-list parse entirely when the body
+        # can't possibly contain a matching item (search results also
+        # match comments, so this is a common case), or when the item
+        # is already checked off
+        if f"#{closed_number}" not in old_body:
+            continue
+        if needs_check.search(old_body) is None:
+            continue
+
+        # Try to check off the task item
+        new_body = set_task_complete(old_body, closed_number, repo=None, complete=True)
+        if new_body != old_body:
+            candidates.append((match_number, new_body))
+
+    if dry_run:
+        result["updated"] = [
+            {"number": n, "action": "would check off"} for n, _ in candidates
+        ]
+        return result
+
+    def _apply(candidate: tuple[int, str]) -> dict[str, Any]:
+        match_number, new_body = candidate
         try:
-            # Fetch full issue body
-            issue_data = client.issue_view(match_number, repo=repo)
-            old_body = issue_data.get("body", "") or ""
-
-            # Try to check off the task item
-            new_body = set_task_complete(old_body, closed_number, repo=None, complete=True)
-
-            if new_body != old_body:
-                if dry_run:
-                    result["updated"].append({
-                        "number": match_number,
-                        "action": "would check off"
-                    })
-                else:
-                    client.issue_edit(match_number, body=new_body, repo=repo)
-                    result["updated"].append({
-                        "number": match_number,
-                        "action": "checked off"
-                    })
+            client.issue_edit(match_number, body=new_body, repo=repo)
+            return {"number": match_number, "action": "checked off"}
         except Exception as e:
-            result["errors"].append({
-                "number": match_number,
-                "error": str(e)
-            })
+            return {"number": match_number, "error": str(e)}
+
+    # The edits are independent gh calls, so fan them out
+    if len(candidates) > 1:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            outcomes = list(executor.map(_apply, candidates))
+    else:
+        outcomes = [_apply(c) for c in candidates]
+
+    for outcome in outcomes:
+        if "error" in outcome:
+            result["errors"].append(outcome)
+        else:
+            result["updated"].append(outcome)
 
     return result
 
@@ -690,28 +918,29 @@ def issue_cmd(
     target_repo = repo or client.get_current_repo()
 
     # Check if this is a view or modify operation
-    is_modification = any([
+    is_modification = any((
         do_close, do_reopen, comment_text, title, body,
         add_labels, remove_labels, add_assignees, remove_assignees,
         add_deps, remove_deps, milestone, status, set_fields,
         start, do_done, shortcut_name,
         check_text, uncheck_text, check_line, uncheck_line,
         edit_comment_id, append_text,
-    ])
+    ))
 
     try:
+        if not is_modification and show_tree:
+            # The tree builder fetches the issue itself, so skip the
+            # up-front view/parse entirely
+            tree = build_dependency_tree(number, client, target_repo)
+            output_json(tree)
+            return
+
         # Always fetch current state
         data = client.issue_view(number, repo=repo)
         current_issue = parse_issue_data(data, target_repo)
 
         if not is_modification:
             # Just viewing
-            if show_tree:
-                # Build and output dependency tree
-                tree = build_dependency_tree(number, client, target_repo)
-                output_json(tree)
-                return
-
             # Enrich dependencies with full context
             if current_issue.dependencies:
                 current_issue.dependencies = enrich_dependencies(
@@ -720,6 +949,12 @@ def issue_cmd(
             output_json(current_issue.to_dict())
             return
 
+        # Parse CSV options once; staging and execute reuse the lists
+        labels_to_add = _split_csv(add_labels)
+        labels_to_remove = _split_csv(remove_labels)
+        assignees_to_add = _split_csv(add_assignees)
+        assignees_to_remove = _split_csv(remove_assignees)
+
         # Build the changes
         changes: dict[str, Any] = {}
         before: dict[str, Any] = {}
@@ -740,41 +975,44 @@ def issue_cmd(
             after["title"] = title
             changes["title"] = {"from": current_issue.title, "to": title}
 
+        # Tracks the body as successive edits stage onto it, so each step
+        # reads one local instead of re-deriving it from the after dict
+        staged_body = current_issue.body
+
         if body is not None:
             before["body"] = current_issue.body
             after["body"] = body
+            staged_body = body
             changes["body"] = {"from": "(current)", "to": "(new)"}
 
-        if add_labels:
-            labels_to_add = [l.strip() for l in add_labels.split(",")]
+        if labels_to_add:
             before["labels"] = current_issue.labels
-            new_labels = list(set(current_issue.labels + labels_to_add))
+            new_labels = list(dict.fromkeys(current_issue.labels + labels_to_add))
             after["labels"] = new_labels
             changes["labels_added"] = labels_to_add
 
-        if remove_labels:
-            labels_to_remove = [l.strip() for l in remove_labels.split(",")]
+        if labels_to_remove:
+            remove_label_set = set(labels_to_remove)
             before["labels"] = current_issue.labels
-            new_labels = [l for l in current_issue.labels if l not in labels_to_remove]
+            new_labels = [l for l in current_issue.labels if l not in remove_label_set]
             after["labels"] = new_labels
             changes["labels_removed"] = labels_to_remove
 
-        if add_assignees:
-            assignees_to_add = [a.strip() for a in add_assignees.split(",")]
+        if assignees_to_add:
             before["assignees"] = current_issue.assignees
-            new_assignees = list(set(current_issue.assignees + assignees_to_add))
+            new_assignees = list(dict.fromkeys(current_issue.assignees + assignees_to_add))
             after["assignees"] = new_assignees
             changes["assignees_added"] = assignees_to_add
 
-        if remove_assignees:
-            assignees_to_remove = [a.strip() for a in remove_assignees.split(",")]
+        if assignees_to_remove:
+            remove_assignee_set = set(assignees_to_remove)
             before["assignees"] = current_issue.assignees
-            new_assignees = [a for a in current_issue.assignees if a not in assignees_to_remove]
+            new_assignees = [a for a in current_issue.assignees if a not in remove_assignee_set]
             after["assignees"] = new_assignees
             changes["assignees_removed"] = assignees_to_remove
 
         if add_deps:
-            deps_to_add = [d.strip() for d in add_deps.split(",")]
+            deps_to_add = _split_csv(add_deps)
             # Parse as ints or strings
             parsed_deps: list[int | str] = []
             for d in deps_to_add:
@@ -785,10 +1023,11 @@ def issue_cmd(
             new_body = add_dependencies(current_issue.body, parsed_deps)
             before["body"] = current_issue.body
             after["body"] = new_body
+            staged_body = new_body
             changes["dependencies_added"] = deps_to_add
 
         if remove_deps:
-            deps_to_remove = [d.strip() for d in remove_deps.split(",")]
+            deps_to_remove = _split_csv(remove_deps)
             parsed_deps_remove: list[int | str] = []
             for d in deps_to_remove:
                 if "#" in d:
@@ -796,61 +1035,54 @@ def issue_cmd(
                 else:
                     parsed_deps_remove.append(int(d))
             # Start from modified body if deps were added, else current
-            base_body = after.get("body", current_issue.body)
-            new_body = remove_dependencies(base_body, parsed_deps_remove)
+            new_body = remove_dependencies(staged_body, parsed_deps_remove)
             before["body"] = current_issue.body
             after["body"] = new_body
+            staged_body = new_body
             changes["dependencies_removed"] = deps_to_remove
 
-        # Task list toggling
-        if check_text or uncheck_text:
-            from betterbeads.parser import toggle_task_by_text
+        # Task list toggling — toggles preserve line positions, so all four
+        # operations share one scan of the body
+        if check_text or uncheck_text or check_line or uncheck_line:
+            task_index = TaskIndex(staged_body)
+            any_toggled = False
 
-            base_body = after.get("body", current_issue.body)
             if check_text:
-                new_body, toggled = toggle_task_by_text(base_body, check_text, complete=True)
+                toggled = task_index.toggle_by_text(check_text, complete=True)
                 if toggled:
-                    before["body"] = current_issue.body
-                    after["body"] = new_body
+                    any_toggled = True
                     changes["tasks_checked"] = [{"text": t.text, "line": t.line_number} for t in toggled]
                 else:
                     click.echo(f"Warning: No task items matching '{check_text}' found", err=True)
             if uncheck_text:
-                base_body = after.get("body", current_issue.body)
-                new_body, toggled = toggle_task_by_text(base_body, uncheck_text, complete=False)
+                toggled = task_index.toggle_by_text(uncheck_text, complete=False)
                 if toggled:
-                    before["body"] = current_issue.body
-                    after["body"] = new_body
+                    any_toggled = True
                     changes["tasks_unchecked"] = [{"text": t.text, "line": t.line_number} for t in toggled]
                 else:
                     click.echo(f"Warning: No task items matching '{uncheck_text}' found", err=True)
-
-        if check_line or uncheck_line:
-            from betterbeads.parser import toggle_task_at_line
-
             if check_line:
-                base_body = after.get("body", current_issue.body)
-                new_body, toggled = toggle_task_at_line(base_body, check_line, complete=True)
-                if toggled:
-                    before["body"] = current_issue.body
-                    after["body"] = new_body
-                    changes["task_checked_at_line"] = {"text": toggled.text, "line": check_line}
+                toggled_item = task_index.toggle_at_line(check_line, complete=True)
+                if toggled_item:
+                    any_toggled = True
+                    changes["task_checked_at_line"] = {"text": toggled_item.text, "line": check_line}
                 else:
                     click.echo(f"Warning: No task item found at line {check_line}", err=True)
             if uncheck_line:
-                base_body = after.get("body", current_issue.body)
-                new_body, toggled = toggle_task_at_line(base_body, uncheck_line, complete=False)
-                if toggled:
-                    before["body"] = current_issue.body
-                    after["body"] = new_body
-                    changes["task_unchecked_at_line"] = {"text": toggled.text, "line": uncheck_line}
+                toggled_item = task_index.toggle_at_line(uncheck_line, complete=False)
+                if toggled_item:
+                    any_toggled = True
+                    changes["task_unchecked_at_line"] = {"text": toggled_item.text, "line": uncheck_line}
                 else:
                     click.echo(f"Warning: No task item found at line {uncheck_line}", err=True)
 
+            if any_toggled:
+                before["body"] = current_issue.body
+                after["body"] = task_index.content
+                staged_body = task_index.content
+
         # Section-based editing
         if section_name and body is not None:
-            from betterbeads.parser import replace_section_content
-
             base_body = current_issue.body  # Start from original for section replacement
             new_body = replace_section_content(base_body, section_name, body)
             if new_body == base_body:
@@ -858,42 +1090,46 @@ def issue_cmd(
             else:
                 before["body"] = current_issue.body
                 after["body"] = new_body
+                staged_body = new_body
                 changes["section_replaced"] = section_name
 
         if append_text:
-            from betterbeads.parser import append_to_section
-
-            base_body = after.get("body", current_issue.body)
             if section_name:
-                new_body = append_to_section(base_body, section_name, append_text)
-                if new_body == base_body:
+                new_body = append_to_section(staged_body, section_name, append_text)
+                if new_body == staged_body:
                     click.echo(f"Warning: Section '{section_name}' not found", err=True)
                 else:
                     before["body"] = current_issue.body
                     after["body"] = new_body
+                    staged_body = new_body
                     changes["appended_to_section"] = {"section": section_name, "text": append_text}
             else:
                 # Append to end of body
-                new_body = base_body.rstrip() + "\n" + append_text + "\n"
+                new_body = staged_body.rstrip() + "\n" + append_text + "\n"
                 before["body"] = current_issue.body
                 after["body"] = new_body
+                staged_body = new_body
                 changes["appended_to_body"] = append_text
 
         # Comment editing
         comment_edit_info = None
         if edit_comment_id:
-            # Find the comment
-            comment_found = None
-            for c in current_issue.comments:
-                # Handle both numeric ID and full node ID
-                if str(c.id) == edit_comment_id or edit_comment_id in str(c.id):
-                    comment_found = c
-                    break
+            # Exact lookup first (numeric ID or full node ID), falling back
+            # to a substring scan only for partial IDs
+            comments_by_id = {str(c.id): c for c in current_issue.comments}
+            comment_found = comments_by_id.get(edit_comment_id)
+            if comment_found is None:
+                for c in current_issue.comments:
+                    if edit_comment_id in str(c.id):
+                        comment_found = c
+                        break
             if not comment_found:
                 click.echo(f"Error: Comment with ID '{edit_comment_id}' not found", err=True)
                 click.echo("Available comment IDs:", err=True)
-                for c in current_issue.comments:
-                    click.echo(f"  {c.id} (by {c.author})", err=True)
+                click.echo(
+                    "\n".join(f"  {c.id} (by {c.author})" for c in current_issue.comments),
+                    err=True,
+                )
                 sys.exit(1)
 
             # The body parameter is used for the new comment content
@@ -925,9 +1161,12 @@ def issue_cmd(
 
         # Project status changes
         project_info = None
+        parsed_fields: dict[str, str] = {}
         if status or set_fields:
             resolver = ProjectResolver(client)
-            project_info = resolver.get_project_info_for_issue(number, target_repo, project_name)
+            project_info = resolver.get_project_info_for_issue(
+                number, target_repo, project_name, issue_data=data
+            )
             if not project_info:
                 if project_name:
                     click.echo(f"Error: Issue not found in project '{project_name}'", err=True)
@@ -948,7 +1187,8 @@ def issue_cmd(
                 changes["project_status"] = {"from": current_status, "to": status, "project": project_info.project_title}
 
             if set_fields:
-                parsed_fields = {}
+                # Parse the key=value specs once; the execute branch reuses
+                # parsed_fields instead of re-splitting
                 for field_spec in set_fields:
                     if "=" not in field_spec:
                         click.echo(f"Error: Invalid field format '{field_spec}'. Use key=value.", err=True)
@@ -998,44 +1238,69 @@ def issue_cmd(
             client.issue_reopen(number, comment=comment_text, repo=repo)
             comment_text = None
 
-        if title or add_labels or remove_labels or add_assignees or remove_assignees or milestone:
-            client.issue_edit(
+        # The remaining mutations — metadata edit, comment, comment edit,
+        # project updates — have no ordering dependency on each other
+        # (close/reopen above must finish first), so collect them and run
+        # concurrently when there's more than one
+        mutations: list[Callable[[], Any]] = []
+
+        # Fold metadata and body changes (including dependency
+        # modifications) into one gh call — each issue_edit is a separate
+        # subprocess round trip
+        if title or labels_to_add or labels_to_remove or assignees_to_add or assignees_to_remove or milestone or "body" in after:
+            mutations.append(lambda: client.issue_edit(
                 number,
                 title=title,
-                add_labels=[l.strip() for l in add_labels.split(",")] if add_labels else None,
-                remove_labels=[l.strip() for l in remove_labels.split(",")] if remove_labels else None,
-                add_assignees=[a.strip() for a in add_assignees.split(",")] if add_assignees else None,
-                remove_assignees=[a.strip() for a in remove_assignees.split(",")] if remove_assignees else None,
+                body=after.get("body"),
+                add_labels=labels_to_add,
+                remove_labels=labels_to_remove,
+                add_assignees=assignees_to_add,
+                remove_assignees=assignees_to_remove,
                 milestone=milestone,
                 repo=repo,
-            )
-
-        # Handle body changes (including dependency modifications)
-        if "body" in after:
-            client.issue_edit(number, body=after["body"], repo=repo)
+            ))
 
         # Handle standalone comment
         if comment_text:
-            client.issue_comment(number, comment_text, repo=repo)
+            mutations.append(
+                lambda: client.issue_comment(number, comment_text, repo=repo)
+            )
 
         # Handle comment editing
         if comment_edit_info:
-            client.comment_edit(
+            mutations.append(lambda: client.comment_edit(
                 comment_id=comment_edit_info["comment_id"],
                 body=comment_edit_info["new_body"],
                 repo=repo,
-            )
-
-        # Handle project status changes
-        if project_info and status:
-            resolver = ProjectResolver(client)
-            resolver.set_status(project_info, status)
+            ))
 
-        if project_info and set_fields:
-            resolver = ProjectResolver(client)
-            for field_spec in set_fields:
-                key, value = field_spec.split("=", 1)
-                resolver.set_field(project_info, key, value)
+        # Handle project status changes; reuse the resolver built while
+        # staging changes (it's set whenever project_info is)
+        if project_info and (status or parsed_fields):
+            def _apply_project() -> None:
+                if status:
+                    resolver.set_status(project_info, status)
+                for key, value in parsed_fields.items():
+                    resolver.set_field(project_info, key, value)
+
+            mutations.append(_apply_project)
+
+        if len(mutations) > 1:
+            errors: list[GhError] = []
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [executor.submit(m) for m in mutations]
+                for future in futures:
+                    try:
+                        future.result()
+                    except GhError as e:
+                        errors.append(e)
+            if errors:
+                raise GhError(
+                    "; ".join(str(e) for e in errors),
+                    max(e.returncode for e in errors),
+                )
+        elif mutations:
+            mutations[0]()
 
         # Log executed operation
         op = history.create_operation(
@@ -1108,19 +1373,31 @@ def issues_cmd(
             repo=repo,
         )
 
-        # Parse into models for filtering
+        # Filter on the raw dicts first so discarded items never pay for
+        # full parsing (comments, project items, author objects)
         target_repo = repo or client.get_current_repo()
+        blocked_labels = _blocked_labels() if (ready or blocked) else None
         issues = []
         for item in data:
-            issue = parse_issue_data(item, target_repo)
-
-            # Apply ready/blocked filters
-            if ready and not issue.ready:
-                continue
-            if blocked and not (issue.blocked.directly or issue.blocked.by_dependencies):
-                continue
+            if blocked_labels is not None:
+                label_blocked = not blocked_labels.isdisjoint(
+                    _lower_label_names(item.get("labels", []))
+                )
+                dep_blocked = any(
+                    not d.complete
+                    for d in parse_dependencies(item.get("body", "") or "")
+                )
+                is_ready = (
+                    item.get("state", "").upper() == "OPEN"
+                    and not label_blocked
+                    and not dep_blocked
+                )
+                if ready and not is_ready:
+                    continue
+                if blocked and not (label_blocked or dep_blocked):
+                    continue
 
-            issues.append(issue)
+            issues.append(parse_issue_data(item, target_repo))
 
         output_json([issue.to_dict() for issue in issues])
 
@@ -1168,8 +1445,8 @@ def create_cmd(
         body = add_dependencies(body, deps_list)
 
     # Parse labels and assignees
-    labels_list = [l.strip() for l in labels.split(",")] if labels else None
-    assignees_list = [a.strip() for a in assignees.split(",")] if assignees else None
+    labels_list = _split_csv(labels)
+    assignees_list = _split_csv(assignees)
 
     target_repo = repo or client.get_current_repo()
 
@@ -1265,6 +1542,60 @@ def history_cmd(
     output_json(output)
 
 
+def _undo_state(op: Operation, undo_changes: dict[str, Any]) -> None:
+    if "state" not in op.after:
+        return
+    if op.after["state"] == "closed" and op.before["state"] == "open":
+        undo_changes["action"] = "reopen"
+    elif op.after["state"] == "open" and op.before["state"] == "closed":
+        undo_changes["action"] = "close"
+
+
+def _undo_labels(op: Operation, undo_changes: dict[str, Any]) -> None:
+    before_labels = set(op.before.get("labels", []))
+    after_labels = set(op.after.get("labels", []))
+    added = after_labels - before_labels
+    removed = before_labels - after_labels
+    if added:
+        undo_changes["remove_labels"] = list(added)
+    if removed:
+        undo_changes["add_labels"] = list(removed)
+
+
+def _undo_assignees(op: Operation, undo_changes: dict[str, Any]) -> None:
+    before_assignees = set(op.before.get("assignees", []))
+    after_assignees = set(op.after.get("assignees", []))
+    added = after_assignees - before_assignees
+    removed = before_assignees - after_assignees
+    if added:
+        undo_changes["remove_assignees"] = list(added)
+    if removed:
+        undo_changes["add_assignees"] = list(removed)
+
+
+def _undo_title(op: Operation, undo_changes: dict[str, Any]) -> None:
+    undo_changes["title"] = op.before["title"]
+
+
+def _undo_body(op: Operation, undo_changes: dict[str, Any]) -> None:
+    # Body may be stored in full or as a diff against the after-body
+    restored_body = history.restore_before_body(op)
+    if restored_body is not None:
+        undo_changes["body"] = restored_body
+
+
+# Maps keys in op.before to the handler that reverses that change; undo_cmd
+# dispatches on the key intersection instead of a chain of if-tests
+_UNDO_HANDLERS = {
+    "state": _undo_state,
+    "labels": _undo_labels,
+    "assignees": _undo_assignees,
+    "title": _undo_title,
+    "body": _undo_body,
+    "body_diff": _undo_body,
+}
+
+
 @main.command("undo")
 @with_repo_option
 @click.argument("operation_id", required=False)
@@ -1320,36 +1651,11 @@ def undo_cmd(
         sys.exit(1)
 
     for op in operations:
-        undo_changes = {}
+        undo_changes: dict[str, Any] = {}
 
         # Determine undo actions based on operation
-        if "state" in op.before and "state" in op.after:
-            if op.after["state"] == "closed" and op.before["state"] == "open":
-                undo_changes["action"] = "reopen"
-            elif op.after["state"] == "open" and op.before["state"] == "closed":
-                undo_changes["action"] = "close"
-
-        if "labels" in op.before:
-            added = set(op.after.get("labels", [])) - set(op.before.get("labels", []))
-            removed = set(op.before.get("labels", [])) - set(op.after.get("labels", []))
-            if added:
-                undo_changes["remove_labels"] = list(added)
-            if removed:
-                undo_changes["add_labels"] = list(removed)
-
-        if "assignees" in op.before:
-            added = set(op.after.get("assignees", [])) - set(op.before.get("assignees", []))
-            removed = set(op.before.get("assignees", [])) - set(op.after.get("assignees", []))
-            if added:
-                undo_changes["remove_assignees"] = list(added)
-            if removed:
-                undo_changes["add_assignees"] = list(removed)
-
-        if "title" in op.before:
-            undo_changes["title"] = op.before["title"]
-
-        if "body" in op.before:
-            undo_changes["body"] = op.before["body"]
+        for field in op.before.keys() & _UNDO_HANDLERS.keys():
+            _UNDO_HANDLERS[field](op, undo_changes)
 
         if not execute:
             output = {
@@ -1421,17 +1727,13 @@ def merge_log_cmd(base: str, ours: str, theirs: str, output_path: str) -> None:
 
     This is called by git during merge conflicts.
     """
-    with open(base) as f:
-        base_content = f.read()
-    with open(ours) as f:
-        ours_content = f.read()
-    with open(theirs) as f:
-        theirs_content = f.read()
+    base_content, ours_content, theirs_content = (
+        Path(p).read_text() for p in (base, ours, theirs)
+    )
 
     merged = history.merge_history_files(base_content, ours_content, theirs_content)
 
-    with open(output_path, "w") as f:
-        f.write(merged)
+    Path(output_path).write_text(merged)
 
 
 BB_WORKFLOW_SECTION = """\
@@ -1454,15 +1756,19 @@ def _ensure_global_claude_md() -> bool:
     claude_md = Path.home() / ".claude" / "CLAUDE.md"
     claude_md.parent.mkdir(parents=True, exist_ok=True)
 
-    if claude_md.exists():
+    # Read directly instead of stat-then-read; the missing-file case is
+    # handled by the exception path
+    try:
         content = claude_md.read_text()
-        if BB_WORKFLOW_MARKER in content:
-            return False
-        claude_md.write_text(content.rstrip() + "\n" + BB_WORKFLOW_SECTION)
-    else:
+    except FileNotFoundError:
         claude_md.write_text(
             "# Global Claude Code Rules\n" + BB_WORKFLOW_SECTION
         )
+        return True
+
+    if BB_WORKFLOW_MARKER in content:
+        return False
+    claude_md.write_text(content.rstrip() + "\n" + BB_WORKFLOW_SECTION)
     return True
 
 
@@ -1576,16 +1882,45 @@ def pr_cmd(
     target_repo = repo or client.get_current_repo()
 
     # Check if this is a view or modify operation
-    is_modification = any([
+    is_modification = any((
         approve, request_changes, comment_text, do_merge, mark_ready,
         title, body, add_labels, remove_labels, add_assignees,
         remove_assignees, add_reviewers, status, set_fields, shortcut_name,
-    ])
+    ))
+
+    # Check state is only shown in the view path; modification paths never
+    # read it, so skip that round trip when modifying
+    need_checks = not is_modification
 
     try:
-        # Always fetch current state
-        data = client.pr_view(number, repo=repo)
-        checks = client.pr_checks(number, repo=repo)
+        # Always fetch current state; the view and checks calls are
+        # independent gh round trips, so run them concurrently
+        if need_checks:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                view_future = executor.submit(client.pr_view, number, repo=repo)
+                checks_future = executor.submit(client.pr_checks, number, repo=repo)
+                data = view_future.result()
+                checks = checks_future.result()
+        else:
+            # Modification paths only read a handful of fields; a narrow
+            # query avoids fetching reviews, comments, and diff stats
+            data = client.pr_view(
+                number,
+                repo=repo,
+                fields=[
+                    "number",
+                    "url",
+                    "title",
+                    "body",
+                    "state",
+                    "isDraft",
+                    "labels",
+                    "assignees",
+                    "milestone",
+                    "projectItems",
+                ],
+            )
+            checks = None
         current_pr = parse_pr_data(data, target_repo, checks)
 
         if not is_modification:
@@ -1594,9 +1929,11 @@ def pr_cmd(
 
             # Optionally include full diff
             if show_diff:
-                diff_result = client.run(["pr", "diff", str(number)], repo=repo, check=False)
-                if diff_result.success:
-                    output["diff"] = diff_result.stdout
+                diff = _fetch_pr_diff(
+                    client, number, repo, target_repo, data.get("headRefOid")
+                )
+                if diff is not None:
+                    output["diff"] = diff
 
             output_json(output)
             return
@@ -1606,6 +1943,14 @@ def pr_cmd(
             click.echo("Error: --merge requires --confirm flag", err=True)
             sys.exit(1)
 
+        # Split the CSV options once; the execute branch reuses these
+        # instead of re-splitting
+        labels_to_add = _split_csv(add_labels)
+        labels_to_remove = _split_csv(remove_labels)
+        assignees_to_add = _split_csv(add_assignees)
+        assignees_to_remove = _split_csv(remove_assignees)
+        reviewers_to_add = _split_csv(add_reviewers)
+
         # Build the changes
         changes: dict[str, Any] = {}
         before: dict[str, Any] = {}
@@ -1639,37 +1984,36 @@ def pr_cmd(
             after["body"] = body
             changes["body"] = {"from": "(current)", "to": "(new)"}
 
-        if add_labels:
-            labels_to_add = [l.strip() for l in add_labels.split(",")]
+        if labels_to_add:
             before["labels"] = current_pr.labels
-            new_labels = list(set(current_pr.labels + labels_to_add))
+            new_labels = list(dict.fromkeys(current_pr.labels + labels_to_add))
             after["labels"] = new_labels
             changes["labels_added"] = labels_to_add
 
-        if remove_labels:
-            labels_to_remove = [l.strip() for l in remove_labels.split(",")]
+        if labels_to_remove:
+            remove_label_set = set(labels_to_remove)
             before["labels"] = current_pr.labels
-            new_labels = [l for l in current_pr.labels if l not in labels_to_remove]
+            new_labels = [l for l in current_pr.labels if l not in remove_label_set]
             after["labels"] = new_labels
             changes["labels_removed"] = labels_to_remove
 
-        if add_assignees:
-            assignees_to_add = [a.strip() for a in add_assignees.split(",")]
+        if assignees_to_add:
             changes["assignees_added"] = assignees_to_add
 
-        if remove_assignees:
-            assignees_to_remove = [a.strip() for a in remove_assignees.split(",")]
+        if assignees_to_remove:
             changes["assignees_removed"] = assignees_to_remove
 
-        if add_reviewers:
-            reviewers_to_add = [r.strip() for r in add_reviewers.split(",")]
+        if reviewers_to_add:
             changes["reviewers_added"] = reviewers_to_add
 
         # Project status changes
         project_info = None
+        parsed_fields: dict[str, str] = {}
         if status or set_fields:
             resolver = ProjectResolver(client)
-            project_info = resolver.get_project_info_for_pr(number, target_repo, project_name)
+            project_info = resolver.get_project_info_for_pr(
+                number, target_repo, project_name, pr_data=data
+            )
             if not project_info:
                 if project_name:
                     click.echo(f"Error: PR not found in project '{project_name}'", err=True)
@@ -1690,7 +2034,8 @@ def pr_cmd(
                 changes["project_status"] = {"from": current_status, "to": status, "project": project_info.project_title}
 
             if set_fields:
-                parsed_fields = {}
+                # Parse the key=value specs once; the execute branch reuses
+                # parsed_fields instead of re-splitting
                 for field_spec in set_fields:
                     if "=" not in field_spec:
                         click.echo(f"Error: Invalid field format '{field_spec}'. Use key=value.", err=True)
@@ -1734,21 +2079,18 @@ def pr_cmd(
                 edit_args.extend(["--title", title])
             if body is not None:
                 edit_args.extend(["--body", body])
-            if add_labels:
-                for label in add_labels.split(","):
-                    edit_args.extend(["--add-label", label.strip()])
-            if remove_labels:
-                for label in remove_labels.split(","):
-                    edit_args.extend(["--remove-label", label.strip()])
-            if add_assignees:
-                for assignee in add_assignees.split(","):
-                    edit_args.extend(["--add-assignee", assignee.strip()])
-            if remove_assignees:
-                for assignee in remove_assignees.split(","):
-                    edit_args.extend(["--remove-assignee", assignee.strip()])
-            if add_reviewers:
-                for reviewer in add_reviewers.split(","):
-                    edit_args.extend(["--add-reviewer", reviewer.strip()])
+            # gh accepts comma-separated values for these flags, so pass
+            # each option as one flag pair instead of one per token
+            if labels_to_add:
+                edit_args.extend(["--add-label", ",".join(labels_to_add)])
+            if labels_to_remove:
+                edit_args.extend(["--remove-label", ",".join(labels_to_remove)])
+            if assignees_to_add:
+                edit_args.extend(["--add-assignee", ",".join(assignees_to_add)])
+            if assignees_to_remove:
+                edit_args.extend(["--remove-assignee", ",".join(assignees_to_remove)])
+            if reviewers_to_add:
+                edit_args.extend(["--add-reviewer", ",".join(reviewers_to_add)])
             client.run(edit_args, repo=repo)
 
         if do_merge:
@@ -1760,16 +2102,12 @@ def pr_cmd(
                 repo=repo,
             )
 
-        # Handle project status changes
-        if project_info and status:
-            resolver = ProjectResolver(client)
-            resolver.set_status(project_info, status)
-
-        if project_info and set_fields:
-            resolver = ProjectResolver(client)
-            for field_spec in set_fields:
-                key, value = field_spec.split("=", 1)
-                resolver.set_field(project_info, key, value)
+        # Handle project status and field changes in one aliased GraphQL
+        # mutation (an explicit Status= field spec overrides --status)
+        if project_info and (status or parsed_fields):
+            batch_fields = {"Status": status} if status else {}
+            batch_fields.update(parsed_fields)
+            resolver.set_fields_batch(project_info, batch_fields)
 
         # Log executed operation
         op = history.create_operation(
@@ -1844,15 +2182,14 @@ def prs_cmd(
         target_repo = repo or client.get_current_repo()
         prs = []
         for item in data:
-            pr = parse_pr_data(item, target_repo)
-
-            # Apply draft/ready filters
-            if draft and not pr.draft:
+            # Apply draft/ready filters on the raw payload so filtered-out
+            # entries skip the full parse
+            if draft and not item.get("isDraft"):
                 continue
-            if ready and pr.draft:
+            if ready and item.get("isDraft"):
                 continue
 
-            prs.append(pr)
+            prs.append(parse_pr_data(item, target_repo))
 
         output_json([pr.to_dict() for pr in prs])
 
@@ -1903,9 +2240,9 @@ def pr_create_cmd(
             body = "\n".join(close_refs)
 
     # Parse options
-    labels_list = [l.strip() for l in labels.split(",")] if labels else None
-    assignees_list = [a.strip() for a in assignees.split(",")] if assignees else None
-    reviewers_list = [r.strip() for r in reviewers.split(",")] if reviewers else None
+    labels_list = _split_csv(labels)
+    assignees_list = _split_csv(assignees)
+    reviewers_list = _split_csv(reviewers)
 
     target_repo = repo or client.get_current_repo()
 
@@ -1972,6 +2309,161 @@ def pr_create_cmd(
         sys.exit(e.returncode)
 
 
+@main.command("pr-batch")
+@with_repo_option
+@click.argument("numbers")
+@click.option("--comment", "comment_text", help="Add a comment to each PR")
+@click.option("--add-labels", help="Add labels (comma-separated)")
+@click.option("--remove-labels", help="Remove labels (comma-separated)")
+@click.option("--add-assignees", help="Add assignees (comma-separated)")
+@click.option("--remove-assignees", help="Remove assignees (comma-separated)")
+@click.option("--add-reviewers", help="Add reviewers (comma-separated)")
+@click.option("--status", help="Set project status on each PR")
+@click.option("--shortcut", "shortcut_name", help="Apply a custom shortcut")
+@click.option("--execute", "-x", is_flag=True, help="Execute changes (default is dry-run)")
+@click.pass_context
+def pr_batch_cmd(
+    ctx: click.Context,
+    numbers: str,
+    comment_text: str | None,
+    add_labels: str | None,
+    remove_labels: str | None,
+    add_assignees: str | None,
+    remove_assignees: str | None,
+    add_reviewers: str | None,
+    status: str | None,
+    shortcut_name: str | None,
+    execute: bool,
+) -> None:
+    """Apply the same changes to several PRs concurrently.
+
+    NUMBERS is a comma-separated list of PR numbers. The independent gh
+    calls run in parallel, so batching over N PRs costs roughly one PR's
+    latency instead of N.
+    """
+    token = ctx.obj.get("token")
+    repo = ctx.obj.get("repo")
+    client = get_client(token, repo)
+
+    try:
+        pr_numbers = [int(n) for n in _split_csv(numbers)]
+    except ValueError:
+        click.echo(f"Error: Invalid PR numbers '{numbers}'", err=True)
+        sys.exit(1)
+
+    # Handle custom shortcut by name, same precedence as pr_cmd
+    config = get_config()
+    if shortcut_name:
+        shortcut_config = config.shortcuts.get(shortcut_name)
+        if not shortcut_config:
+            click.echo(f"Error: Unknown shortcut '{shortcut_name}'", err=True)
+            click.echo(f"Available shortcuts: {', '.join(config.shortcuts.keys())}", err=True)
+            sys.exit(1)
+        status = status or shortcut_config.status
+        if shortcut_config.assignees and not add_assignees:
+            add_assignees = ",".join(shortcut_config.assignees)
+        if shortcut_config.labels_add and not add_labels:
+            add_labels = ",".join(shortcut_config.labels_add)
+        if shortcut_config.labels_remove and not remove_labels:
+            remove_labels = ",".join(shortcut_config.labels_remove)
+
+    labels_to_add = _split_csv(add_labels)
+    labels_to_remove = _split_csv(remove_labels)
+    assignees_to_add = _split_csv(add_assignees)
+    assignees_to_remove = _split_csv(remove_assignees)
+    reviewers_to_add = _split_csv(add_reviewers)
+
+    changes: dict[str, Any] = {}
+    if comment_text:
+        changes["comment"] = comment_text
+    if labels_to_add:
+        changes["labels_added"] = labels_to_add
+    if labels_to_remove:
+        changes["labels_removed"] = labels_to_remove
+    if assignees_to_add:
+        changes["assignees_added"] = assignees_to_add
+    if assignees_to_remove:
+        changes["assignees_removed"] = assignees_to_remove
+    if reviewers_to_add:
+        changes["reviewers_added"] = reviewers_to_add
+    if status:
+        changes["project_status"] = status
+
+    if not changes:
+        click.echo("Error: No changes specified", err=True)
+        sys.exit(1)
+
+    target_repo = repo or client.get_current_repo()
+
+    if not execute:
+        output_json({
+            "dry_run": True,
+            "prs": pr_numbers,
+            "repo": target_repo,
+            "changes": changes,
+        })
+        click.echo("\nRun with --execute (-x) to apply changes.", err=True)
+        return
+
+    # One resolver shared across workers so project/field metadata is
+    # fetched once for the whole batch
+    resolver = ProjectResolver(client) if status else None
+
+    def _apply(number: int) -> dict[str, Any]:
+        try:
+            if any((labels_to_add, labels_to_remove, assignees_to_add,
+                    assignees_to_remove, reviewers_to_add)):
+                edit_args = ["pr", "edit", str(number)]
+                if labels_to_add:
+                    edit_args.extend(["--add-label", ",".join(labels_to_add)])
+                if labels_to_remove:
+                    edit_args.extend(["--remove-label", ",".join(labels_to_remove)])
+                if assignees_to_add:
+                    edit_args.extend(["--add-assignee", ",".join(assignees_to_add)])
+                if assignees_to_remove:
+                    edit_args.extend(["--remove-assignee", ",".join(assignees_to_remove)])
+                if reviewers_to_add:
+                    edit_args.extend(["--add-reviewer", ",".join(reviewers_to_add)])
+                client.run(edit_args, repo=repo)
+
+            if comment_text:
+                client.run(["pr", "comment", str(number), "--body", comment_text], repo=repo)
+
+            if resolver and status:
+                project_info = resolver.get_project_info_for_pr(number, target_repo)
+                if project_info:
+                    resolver.set_fields_batch(project_info, {"Status": status})
+
+            op = history.create_operation(
+                target=target_repo,
+                type="pr",
+                num=number,
+                action="modify",
+                before={},
+                after=dict(changes),
+            )
+            history.append_operation(op)
+            return {"pr": number, "executed": True, "operation_id": op.id}
+        except GhError as e:
+            return {"pr": number, "error": str(e)}
+
+    if len(pr_numbers) > 1:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(_apply, pr_numbers))
+    else:
+        results = [_apply(n) for n in pr_numbers]
+
+    errors = [r for r in results if "error" in r]
+    output_json({
+        "executed": True,
+        "repo": target_repo,
+        "changes": changes,
+        "results": results,
+    })
+    if errors:
+        sys.exit(1)
+
+
 @main.command("next")
 @with_repo_option
 @click.option("--label", "-l", "labels", multiple=True, help="Filter by label")
@@ -2070,16 +2562,16 @@ def next_cmd(
             changes["project_status"] = {"from": current_status, "to": status}
 
         if add_assignees:
-            assignees_to_add = [a.strip() for a in add_assignees.split(",")]
+            assignees_to_add = _split_csv(add_assignees)
             before["assignees"] = selected.assignees
-            new_assignees = list(set(selected.assignees + assignees_to_add))
+            new_assignees = list(dict.fromkeys(selected.assignees + assignees_to_add))
             after["assignees"] = new_assignees
             changes["assignees_added"] = assignees_to_add
 
         if add_labels:
-            labels_to_add = [l.strip() for l in add_labels.split(",")]
+            labels_to_add = _split_csv(add_labels)
             before["labels"] = selected.labels
-            new_labels = list(set(selected.labels + labels_to_add))
+            new_labels = list(dict.fromkeys(selected.labels + labels_to_add))
             after["labels"] = new_labels
             changes["labels_added"] = labels_to_add
 
@@ -2114,8 +2606,8 @@ def next_cmd(
         if add_labels or add_assignees:
             client.issue_edit(
                 selected.number,
-                add_labels=[l.strip() for l in add_labels.split(",")] if add_labels else None,
-                add_assignees=[a.strip() for a in add_assignees.split(",")] if add_assignees else None,
+                add_labels=_split_csv(add_labels),
+                add_assignees=_split_csv(add_assignees),
                 repo=repo,
             )
 
@@ -2164,6 +2656,104 @@ def next_cmd(
 # =============================================================================
 
 
+# Static markdown blocks for session-start, joined with the dynamic
+# per-issue lines at emit time
+_SESSION_START_PREAMBLE = """## GitHub Context for {repo}
+
+**ALWAYS use `bb` for all GitHub operations** (issues, PRs, projects) - never use `gh` directly.
+"""
+
+_INSTALL_INSTRUCTIONS = """### Installation Required
+
+The `bb` command is not installed. Install it with:
+
+```bash
+uv tool install git+https://github.com/falense/betterbeads
+```
+
+Or for local development (from the betterbeads repo):
+```bash
+uv tool install --force --editable .
+```
+"""
+
+_ISSUE_REQUIREMENT = """### Issue Requirement
+**All work must have an accompanying GitHub issue.**
+- Before starting ANY work, identify or create the relevant issue
+- If no issue exists, create one with `bb create`
+- Reference the issue number in commits
+"""
+
+
+def _which(name: str) -> bool:
+    """Check PATH for an executable without importing shutil."""
+    return any(
+        os.access(os.path.join(d, name), os.X_OK)
+        for d in os.environ.get("PATH", "").split(os.pathsep)
+        if d
+    )
+
+
+def _emit_hook_output(lines: list[str]) -> None:
+    """Emit hook markdown in one stdout write.
+
+    Hooks emit plain markdown, so click.echo's per-call unicode/color
+    handling is skipped in favor of a single write and flush.
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+# Fields the hooks actually read: display fields plus body and labels,
+# which drive the ready/blocked computation
+_HOOK_ISSUE_FIELDS = ["number", "url", "title", "body", "state", "labels", "assignees"]
+
+
+def _cached_issue_list(
+    client: "GhClient",
+    repo_name: str,
+    state: str,
+    limit: int,
+    ttl: float = 60.0,
+    exclude_labels: list[str] | None = None,
+) -> list[dict[str, Any]]:
+    """List hook issues, serving repeat calls from a short-TTL disk cache.
+
+    Hooks fire on every session start/stop, often seconds apart; a 60s
+    cache turns the repeat network round trips into disk reads without
+    the output going meaningfully stale. Only the fields the hooks read
+    are requested.
+    """
+    key = hashlib.blake2b(
+        f"{repo_name}:{state}:{limit}:{exclude_labels or ''}".encode(),
+        digest_size=16,
+    ).hexdigest()
+    cache_path = Path.home() / ".cache" / "betterbeads" / "issues" / key
+    try:
+        cached = json.loads(cache_path.read_text())
+        if time.time() - cached["ts"] < ttl:
+            return cached["data"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    data = client.issue_list(
+        state=state,
+        limit=limit,
+        fields=_HOOK_ISSUE_FIELDS,
+        exclude_labels=exclude_labels,
+    )
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        tmp_path.write_text(json.dumps({"ts": time.time(), "data": data}))
+        tmp_path.replace(cache_path)
+    except OSError:
+        pass  # Caching is best-effort
+
+    return data
+
+
 @main.group("hook")
 def hook_group() -> None:
     """Claude Code hook commands.
@@ -2182,113 +2772,105 @@ def hook_session_start(ctx: click.Context) -> None:
 
     Reads hook input JSON from stdin, outputs markdown to stdout.
     """
-    import shutil
+    # Guard against accidental interactive invocations; set BB_FORCE_HOOK
+    # to run the hook logic from a terminal anyway
+    if sys.stdin.isatty() and not os.environ.get("BB_FORCE_HOOK"):
+        click.echo("This command is intended to be run as a Claude Code hook.", err=True)
+        sys.exit(0)
 
     # Read hook input from stdin
     hook_input = {}
     if not sys.stdin.isatty():
         try:
-            hook_input = json.load(sys.stdin)
-        except json.JSONDecodeError:
+            raw = sys.stdin.buffer.read()
+            hook_input = _loads(raw) if raw else {}
+        except ValueError:
             pass
 
-    cwd = hook_input.get("cwd", ".")
-
     # Get repo from context (--repo option) or auto-detect
     repo = ctx.obj.get("repo")
-    from .gh import GhClient
-    client = GhClient(repo=repo)
+    client = get_client(None, repo)
 
+    data: list[dict[str, Any]] = []
     if repo:
         repo_name = repo
-    else:
         try:
-            repo_name = client.get_current_repo()
+            data = _cached_issue_list(client, repo_name, state="open", limit=15)
         except Exception:
-            # Not a GitHub repo, exit silently
-            sys.exit(0)
+            pass
+    else:
+        # Repo detection and the issue fetch are independent subprocesses;
+        # run them concurrently and discard the speculative fetch if
+        # detection fails. The fetch is keyed by cwd since without an
+        # explicit repo that is what determines its result.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            repo_future = executor.submit(client.get_current_repo)
+            issues_future = executor.submit(
+                _cached_issue_list, client, f"cwd:{Path.cwd()}", "open", 15
+            )
+            try:
+                repo_name = repo_future.result()
+            except Exception:
+                repo_name = None
+            try:
+                data = issues_future.result()
+            except Exception:
+                pass
 
     if not repo_name:
+        # Not a GitHub repo, exit silently
         sys.exit(0)
 
     # Check if bb is properly available (sanity check)
-    bb_installed = shutil.which("bb") is not None
+    bb_installed = _which("bb")
 
-    # Get open issues
-    all_issues = []
+    # Partition open issues by readiness in one pass
     ready_issues = []
+    other_issues = []
 
     try:
-        data = client.issue_list(state="open", limit=20)
         for item in data:
-            issue = parse_issue_data(item, repo_name)
-            all_issues.append(issue)
+            issue = parse_issue_data_lite(item, repo_name)
             if issue.ready:
                 ready_issues.append(issue)
+            else:
+                other_issues.append(issue)
     except Exception:
         pass
 
-    # Build output
-    lines = [f"## GitHub Context for {repo_name}"]
-    lines.append("")
-    lines.append("**ALWAYS use `bb` for all GitHub operations** (issues, PRs, projects) - never use `gh` directly.")
-    lines.append("")
+    # Build output: static preamble blocks, then per-issue lines
+    lines = [_SESSION_START_PREAMBLE.format(repo=repo_name)]
+    w = lines.append  # Bound once; skips the attribute lookup per line
 
     # Add installation instructions if bb is not installed
     if not bb_installed:
-        lines.extend([
-            "### Installation Required",
-            "",
-            "The `bb` command is not installed. Install it with:",
-            "",
-            "```bash",
-            "uv tool install git+https://github.com/falense/betterbeads",
-            "```",
-            "",
-            "Or for local development (from the betterbeads repo):",
-            "```bash",
-            "uv tool install --force --editable .",
-            "```",
-            "",
-        ])
-
-    lines.append("### Issue Requirement")
-    lines.append("**All work must have an accompanying GitHub issue.**")
-    lines.append("- Before starting ANY work, identify or create the relevant issue")
-    lines.append("- If no issue exists, create one with `bb create`")
-    lines.append("- Reference the issue number in commits")
-    lines.append("")
+        w(_INSTALL_INSTRUCTIONS)
+
+    w(_ISSUE_REQUIREMENT)
 
-    if not all_issues:
-        lines.append("No open issues found.")
-        lines.append("")
-        click.echo("\n".join(lines))
+    if not ready_issues and not other_issues:
+        w("No open issues found.")
+        w("")
+        _emit_hook_output(lines)
         sys.exit(0)
 
     if ready_issues:
-        lines.append(f"### Ready for Work ({len(ready_issues)} issues)")
-        lines.append("These issues have no blockers and all dependencies are complete:")
-        lines.append("")
+        w(f"### Ready for Work ({len(ready_issues)} issues)")
+        w("These issues have no blockers and all dependencies are complete:")
+        w("")
         for issue in ready_issues:
-            lines.append(_format_issue_for_hook(issue))
-            lines.append("")
+            w(_format_issue_for_hook(issue))
+            w("")
 
     # Show other open issues
-    ready_numbers = {i.number for i in ready_issues}
-    other_issues = [i for i in all_issues if i.number not in ready_numbers]
-
     if other_issues:
-        lines.append(f"### Other Open Issues ({len(other_issues)} issues)")
-        lines.append("")
+        w(f"### Other Open Issues ({len(other_issues)} issues)")
+        w("")
         for issue in other_issues[:10]:
-            lines.append(_format_issue_for_hook(issue))
-            lines.append("")
+            w(_format_issue_for_hook(issue))
+            w("")
 
-    total = len(all_issues)
-    if total > 20:
-        lines.append(f"... and {total - 20} more open issues")
-
-    click.echo("\n".join(lines))
+    _emit_hook_output(lines)
     sys.exit(0)
 
 
@@ -2301,27 +2883,32 @@ def hook_session_stop(ctx: click.Context) -> None:
     Only outputs if enabled in .betterbeads/config.json:
     {"hooks": {"session_stop": {"enabled": true}}}
     """
-    # Read hook input from stdin
-    hook_input = {}
-    if not sys.stdin.isatty():
-        try:
-            hook_input = json.load(sys.stdin)
-        except json.JSONDecodeError:
-            pass
-
-    cwd = hook_input.get("cwd", ".")
+    # Guard against accidental interactive invocations; set BB_FORCE_HOOK
+    # to run the hook logic from a terminal anyway
+    if sys.stdin.isatty() and not os.environ.get("BB_FORCE_HOOK"):
+        click.echo("This command is intended to be run as a Claude Code hook.", err=True)
+        sys.exit(0)
 
-    # Load config and check if hook is enabled
+    # Check if the hook is enabled before doing any other work; disabled
+    # is the common case and should cost only the config load
     config = get_config()
     hooks_config = config.raw.get("hooks", {}) if hasattr(config, "raw") else {}
     session_stop_config = hooks_config.get("session_stop", {})
     if not session_stop_config.get("enabled", False):
         sys.exit(0)
 
+    # Read hook input from stdin
+    hook_input = {}
+    if not sys.stdin.isatty():
+        try:
+            raw = sys.stdin.buffer.read()
+            hook_input = _loads(raw) if raw else {}
+        except ValueError:
+            pass
+
     # Get repo from context (--repo option) or auto-detect
     repo = ctx.obj.get("repo")
-    from .gh import GhClient
-    client = GhClient(repo=repo)
+    client = get_client(None, repo)
 
     if repo:
         repo_name = repo
@@ -2337,9 +2924,17 @@ def hook_session_stop(ctx: click.Context) -> None:
     # Get ready issues
     ready_issues = []
     try:
-        data = client.issue_list(state="open", limit=10)
+        # Blocked labels are excluded server-side; the local ready check
+        # still filters issues with incomplete dependencies
+        data = _cached_issue_list(
+            client,
+            repo_name,
+            state="open",
+            limit=5,
+            exclude_labels=sorted(_blocked_labels()),
+        )
         for item in data:
-            issue = parse_issue_data(item, repo_name)
+            issue = parse_issue_data_lite(item, repo_name)
             if issue.ready:
                 ready_issues.append(issue)
     except Exception:
@@ -2362,18 +2957,15 @@ def hook_session_stop(ctx: click.Context) -> None:
     lines.append("Use `bb issue <number>` to view details and continue working.")
     lines.append("")
 
-    click.echo("\n".join(lines))
+    _emit_hook_output(lines)
     sys.exit(0)
 
 
 def _format_issue_for_hook(issue: Issue) -> str:
     """Format an issue for hook output."""
-    parts = [f"#{issue.number}: {issue.title}"]
-    if issue.labels:
-        parts.append(f"  Labels: {', '.join(issue.labels)}")
-    if issue.assignees:
-        parts.append(f"  Assigned: {', '.join(issue.assignees)}")
-    return "\n".join(parts)
+    labels = f"\n  Labels: {', '.join(issue.labels)}" if issue.labels else ""
+    assignees = f"\n  Assigned: {', '.join(issue.assignees)}" if issue.assignees else ""
+    return f"#{issue.number}: {issue.title}{labels}{assignees}"
 
 
 if __name__ == "__main__":
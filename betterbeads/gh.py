@@ -32,6 +32,48 @@ class GhResult:
         return json.loads(self.stdout)
 
 
+# Full --json field lists; callers that only need a subset can pass
+# fields= to shrink the query
+_ISSUE_LIST_FIELDS = [
+    "number",
+    "url",
+    "title",
+    "body",
+    "state",
+    "labels",
+    "assignees",
+    "author",
+    "createdAt",
+    "updatedAt",
+]
+
+_PR_VIEW_FIELDS = [
+    "number",
+    "url",
+    "title",
+    "body",
+    "state",
+    "isDraft",
+    "author",
+    "createdAt",
+    "updatedAt",
+    "baseRefName",
+    "headRefName",
+    "headRefOid",
+    "mergeable",
+    "labels",
+    "assignees",
+    "reviewRequests",
+    "reviews",
+    "comments",
+    "milestone",
+    "projectItems",
+    "additions",
+    "deletions",
+    "changedFiles",
+]
+
+
 class GhClient:
     """Client for executing gh commands."""
 
@@ -44,6 +86,8 @@ class GhClient:
         """
         self.token = token
         self.repo = repo
+        self._current_repo: str | None = None
+        self._issue_cache: dict[tuple[str | None, int], dict[str, Any]] = {}
         self._check_gh_installed()
 
     def _check_gh_installed(self) -> None:
@@ -89,7 +133,11 @@ class GhClient:
         Returns:
             GhResult with stdout, stderr, returncode
         """
-        cmd = ["gh"] + args + self._get_repo_args(repo)
+        # gh api does not accept --repo; only add it for regular subcommands
+        if args and args[0] == "api":
+            cmd = ["gh"] + args
+        else:
+            cmd = ["gh"] + args + self._get_repo_args(repo)
 
         result = subprocess.run(
             cmd,
@@ -110,14 +158,34 @@ class GhClient:
         return gh_result
 
     def get_current_repo(self) -> str:
-        """Get the current repository from git remote."""
-        result = self.run(["repo", "view", "--json", "nameWithOwner", "-q", ".nameWithOwner"])
-        return result.stdout.strip()
+        """Get the current repository from git remote.
+
+        The remote doesn't change within an invocation, so the result is
+        cached after the first gh call.
+        """
+        if self._current_repo is None:
+            result = self.run(["repo", "view", "--json", "nameWithOwner", "-q", ".nameWithOwner"])
+            self._current_repo = result.stdout.strip()
+        return self._current_repo
 
     # Issue operations
 
+    def _invalidate_issue(self, number: int, repo: str | None) -> None:
+        """Drop the cached view for an issue after a mutation."""
+        self._issue_cache.pop((repo or self.repo, number), None)
+
     def issue_view(self, number: int, repo: str | None = None) -> dict[str, Any]:
-        """Get issue data."""
+        """Get issue data.
+
+        Views are cached per (repo, number) for the life of the client,
+        so tree walks and enrichment passes that revisit an issue don't
+        re-spawn gh. Mutating calls invalidate the affected entry.
+        """
+        cache_key = (repo or self.repo, number)
+        cached = self._issue_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         fields = [
             "number",
             "url",
@@ -137,7 +205,65 @@ class GhClient:
             ["issue", "view", str(number), "--json", ",".join(fields)],
             repo=repo,
         )
-        return result.json()
+        data = result.json()
+        self._issue_cache[cache_key] = data
+        return data
+
+    def issues_view_batch(
+        self,
+        numbers: list[int],
+        repo: str | None = None,
+        batch_size: int = 50,
+    ) -> dict[int, dict[str, Any]]:
+        """Get data for multiple issues in a single GraphQL query.
+
+        Uses aliased `issue(number: N)` fields so a whole batch costs one
+        round-trip instead of one `gh issue view` per issue.
+
+        Args:
+            numbers: Issue numbers to fetch
+            repo: Repository in owner/repo format (defaults to current repo)
+            batch_size: Maximum issues per GraphQL request
+
+        Returns:
+            Dict mapping issue number to issue data. Issues that could not
+            be fetched are absent from the result.
+        """
+        target_repo = repo or self.repo or self.get_current_repo()
+        owner, name = target_repo.split("/", 1)
+
+        results: dict[int, dict[str, Any]] = {}
+        for start in range(0, len(numbers), batch_size):
+            chunk = numbers[start : start + batch_size]
+            selections = " ".join(
+                f"i{n}: issue(number: {n}) "
+                "{ number title state body labels(first: 50) { nodes { name } } }"
+                for n in chunk
+            )
+            query = f'query {{ repository(owner: "{owner}", name: "{name}") {{ {selections} }} }}'
+
+            # check=False: a missing issue fails the whole request, but gh
+            # still returns partial data for the aliases that resolved.
+            result = self.run(["api", "graphql", "-f", f"query={query}"], check=False)
+            if not result.stdout.strip():
+                if not result.success:
+                    raise GhError(result.stderr.strip(), result.returncode)
+                continue
+
+            try:
+                data = json.loads(result.stdout)
+            except json.JSONDecodeError:
+                raise GhError(result.stderr.strip() or "Invalid GraphQL response")
+
+            repository = (data.get("data") or {}).get("repository") or {}
+            for n in chunk:
+                issue = repository.get(f"i{n}")
+                if issue:
+                    # Normalize labels to the REST shape ([{"name": ...}])
+                    issue["labels"] = (issue.get("labels") or {}).get("nodes", [])
+                    results[issue["number"]] = issue
+
+        return results
 
     def issue_list(
         self,
@@ -146,8 +272,19 @@ class GhClient:
         assignee: str | None = None,
         limit: int = 30,
         repo: str | None = None,
+        fields: list[str] | None = None,
+        exclude_labels: list[str] | None = None,
     ) -> list[dict[str, Any]]:
-        """List issues."""
+        """List issues.
+
+        Args:
+            fields: Optional subset of --json fields to request; defaults
+                to the full set.
+            exclude_labels: Labels to filter out server-side via search
+                syntax, so excluded issues never hit the wire.
+        """
+        if fields is None:
+            fields = _ISSUE_LIST_FIELDS
         args = [
             "issue",
             "list",
@@ -156,13 +293,16 @@ class GhClient:
             "--limit",
             str(limit),
             "--json",
-            "number,url,title,body,state,labels,assignees,author,createdAt,updatedAt",
+            ",".join(fields),
         ]
         if labels:
             for label in labels:
                 args.extend(["--label", label])
         if assignee:
             args.extend(["--assignee", assignee])
+        if exclude_labels:
+            search = " ".join(f'-label:"{label}"' for label in exclude_labels)
+            args.extend(["--search", search])
 
         result = self.run(args, repo=repo)
         return result.json()
@@ -229,6 +369,7 @@ class GhClient:
         if milestone:
             args.extend(["--milestone", milestone])
 
+        self._invalidate_issue(number, repo)
         return self.run(args, repo=repo)
 
     def issue_close(
@@ -244,6 +385,7 @@ class GhClient:
             args.extend(["--reason", reason])
         if comment:
             args.extend(["--comment", comment])
+        self._invalidate_issue(number, repo)
         return self.run(args, repo=repo)
 
     def issue_reopen(
@@ -256,6 +398,7 @@ class GhClient:
         args = ["issue", "reopen", str(number)]
         if comment:
             args.extend(["--comment", comment])
+        self._invalidate_issue(number, repo)
         return self.run(args, repo=repo)
 
     def issue_comment(
@@ -265,6 +408,7 @@ class GhClient:
         repo: str | None = None,
     ) -> GhResult:
         """Add a comment to an issue."""
+        self._invalidate_issue(number, repo)
         return self.run(
             ["issue", "comment", str(number), "--body", body],
             repo=repo,
@@ -321,32 +465,23 @@ class GhClient:
 
     # PR operations
 
-    def pr_view(self, number: int, repo: str | None = None) -> dict[str, Any]:
-        """Get PR data."""
-        fields = [
-            "number",
-            "url",
-            "title",
-            "body",
-            "state",
-            "isDraft",
-            "author",
-            "createdAt",
-            "updatedAt",
-            "baseRefName",
-            "headRefName",
-            "mergeable",
-            "labels",
-            "assignees",
-            "reviewRequests",
-            "reviews",
-            "comments",
-            "milestone",
-            "projectItems",
-            "additions",
-            "deletions",
-            "changedFiles",
-        ]
+    def pr_view(
+        self,
+        number: int,
+        repo: str | None = None,
+        fields: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Get PR data.
+
+        Args:
+            number: The PR number
+            repo: Optional repo in owner/repo format
+            fields: Optional subset of --json fields to request; defaults
+                to the full set. Callers that only need a few fields can
+                pass them to shrink the query gh sends.
+        """
+        if fields is None:
+            fields = _PR_VIEW_FIELDS
         result = self.run(
             ["pr", "view", str(number), "--json", ",".join(fields)],
             repo=repo,
@@ -500,7 +635,7 @@ class GhClient:
                 "--limit",
                 str(limit),
                 "--json",
-                "number,url,title,state,labels,repository",
+                "number,url,title,state,body,labels,repository",
             ]
         )
         return result.json()
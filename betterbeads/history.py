@@ -1,5 +1,8 @@
 """Transaction log for operations."""
 
+import atexit
+import difflib
+import hashlib
 import json
 import os
 import secrets
@@ -112,22 +115,69 @@ def setup_merge_driver() -> bool:
         return False
 
 
-def append_operation(op: Operation) -> bool:
-    """Append an operation to the history log.
+# Operations buffered for a single write (and fsync) at process exit, so
+# commands logging several operations don't pay one open/write/close each
+_pending_ops: list[Operation] = []
+_flush_registered = False
+
+
+def flush_pending_operations() -> None:
+    """Write all buffered operations to the history log in one append."""
+    if not _pending_ops:
+        return
 
-    Returns True if successful.
-    """
     ensure_history_dir()
     history_path = get_history_path()
     if not history_path:
-        return False
+        _pending_ops.clear()
+        return
 
-    line = op.to_json_line()
     with open(history_path, "a") as f:
-        f.write(line + "\n")
+        f.write("".join(op.to_json_line() + "\n" for op in _pending_ops))
+        f.flush()
+        os.fsync(f.fileno())
+    _pending_ops.clear()
+
+
+def append_operation(op: Operation) -> bool:
+    """Queue an operation for the history log.
+
+    Writes are buffered and flushed in a single append at process exit
+    (or via flush_pending_operations).
+
+    Returns True if the operation will be logged.
+    """
+    global _flush_registered
+
+    if not get_history_path():
+        return False
+
+    _pending_ops.append(op)
+    if not _flush_registered:
+        atexit.register(flush_pending_operations)
+        _flush_registered = True
     return True
 
 
+def _iter_lines_reversed(path: Path, block_size: int = 65536):
+    """Yield lines of a file last-to-first, reading in blocks from the end."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        buf = b""
+        while pos > 0:
+            read_size = min(block_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            buf = f.read(read_size) + buf
+            lines = buf.split(b"\n")
+            buf = lines[0]
+            for line in reversed(lines[1:]):
+                yield line
+        if buf:
+            yield buf
+
+
 def read_history(
     limit: int | None = None,
     issue: int | None = None,
@@ -136,6 +186,11 @@ def read_history(
 ) -> list[Operation]:
     """Read operations from history log.
 
+    The log is kept in timestamp order (appends are chronological and the
+    merge driver sorts), so the file is streamed from the end and reading
+    stops as soon as the limit is satisfied or operations get older than
+    `since` — recent-history queries don't pay for the whole file.
+
     Args:
         limit: Maximum number of operations to return (most recent first)
         issue: Filter by issue/PR number
@@ -150,32 +205,29 @@ def read_history(
         return []
 
     operations = []
-    with open(history_path, "r") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                op = Operation.from_json_line(line)
-                operations.append(op)
-            except (json.JSONDecodeError, KeyError):
-                continue  # Skip malformed lines
-
-    # Filter
-    if issue is not None:
-        operations = [op for op in operations if op.num == issue]
-    if target_repo:
-        operations = [op for op in operations if op.target == target_repo]
-    if since:
-        operations = [op for op in operations if op.ts >= since]
+    for raw_line in _iter_lines_reversed(history_path):
+        line = raw_line.decode("utf-8", errors="replace").strip()
+        if not line:
+            continue
+        try:
+            op = Operation.from_json_line(line)
+        except (json.JSONDecodeError, KeyError):
+            continue  # Skip malformed lines
+
+        if since and op.ts < since:
+            break  # Everything before this line is older still
+        if issue is not None and op.num != issue:
+            continue
+        if target_repo and op.target != target_repo:
+            continue
+
+        operations.append(op)
+        if limit and len(operations) >= limit:
+            break
 
     # Sort by timestamp descending (most recent first)
     operations.sort(key=lambda op: op.ts, reverse=True)
 
-    # Limit
-    if limit:
-        operations = operations[:limit]
-
     return operations
 
 
@@ -200,6 +252,57 @@ def get_operation(op_id: str) -> Operation | None:
     return None
 
 
+def _compact_body_change(
+    before: dict[str, Any], after: dict[str, Any]
+) -> dict[str, Any]:
+    """Replace a full before-body with a diff against the after-body.
+
+    Issue bodies can be tens of KB and body edits would otherwise store
+    both versions in full. Keeping only the new body plus a line diff
+    (and a hash to verify reconstruction) roughly halves the record.
+    """
+    before_body = before.get("body")
+    after_body = after.get("body")
+    if not isinstance(before_body, str) or not isinstance(after_body, str):
+        return before
+
+    compact = dict(before)
+    del compact["body"]
+    compact["body_hash"] = hashlib.blake2b(
+        before_body.encode(), digest_size=16
+    ).hexdigest()
+    compact["body_diff"] = list(
+        difflib.ndiff(
+            before_body.splitlines(keepends=True),
+            after_body.splitlines(keepends=True),
+        )
+    )
+    return compact
+
+
+def restore_before_body(op: Operation) -> str | None:
+    """Reconstruct the before-body of an operation.
+
+    Handles both full-body records and compacted diff records; returns
+    None if the record has no body change or reconstruction fails the
+    hash check.
+    """
+    if "body" in op.before:
+        return op.before["body"]
+
+    diff = op.before.get("body_diff")
+    if diff is None:
+        return None
+
+    body = "".join(difflib.restore(diff, 1))
+    expected = op.before.get("body_hash")
+    if expected:
+        actual = hashlib.blake2b(body.encode(), digest_size=16).hexdigest()
+        if actual != expected:
+            return None
+    return body
+
+
 def create_operation(
     target: str,
     type: str,
@@ -216,7 +319,7 @@ def create_operation(
         type=type,
         num=num,
         action=action,
-        before=before,
+        before=_compact_body_change(before, after),
         after=after,
     )
 
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """GitHub user."""
 
@@ -13,7 +13,7 @@ class User:
     name: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Milestone:
     """GitHub milestone."""
 
@@ -21,7 +21,7 @@ class Milestone:
     due_on: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Comment:
     """Issue or PR comment."""
 
@@ -31,7 +31,7 @@ class Comment:
     created_at: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Dependency:
     """Issue dependency from task list."""
 
@@ -44,7 +44,7 @@ class Dependency:
     blocked: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Dependent:
     """Issue that depends on this one."""
 
@@ -54,7 +54,7 @@ class Dependent:
     state: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LinkedPR:
     """PR linked to an issue."""
 
@@ -64,7 +64,7 @@ class LinkedPR:
     author: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectItem:
     """Issue/PR status in a project."""
 
@@ -73,7 +73,7 @@ class ProjectItem:
     fields: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockedStatus:
     """Whether an issue is blocked and why."""
 
@@ -82,7 +82,7 @@ class BlockedStatus:
     reasons: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Issue:
     """GitHub issue with full context."""
 
@@ -178,7 +178,7 @@ class Issue:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Review:
     """PR review."""
 
@@ -188,7 +188,7 @@ class Review:
     submitted_at: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckItem:
     """CI check item."""
 
@@ -198,7 +198,7 @@ class CheckItem:
     url: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckStatus:
     """Overall CI check status."""
 
@@ -206,7 +206,7 @@ class CheckStatus:
     items: list[CheckItem] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class DiffStats:
     """PR diff statistics."""
 
@@ -215,7 +215,7 @@ class DiffStats:
     changed_files: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PR:
     """GitHub pull request with full context."""
 
@@ -313,7 +313,7 @@ class PR:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Operation:
     """Recorded operation for transaction log."""
 
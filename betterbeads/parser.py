@@ -1,5 +1,6 @@
 """Task list parsing and modification for dependencies and general task items."""
 
+import functools
 import re
 from dataclasses import dataclass
 
@@ -88,17 +89,30 @@ def parse_task_items(content: str) -> list[TaskItem]:
     return items
 
 
+@functools.lru_cache(maxsize=128)
+def _parse_dependencies_cached(body: str) -> tuple[TaskItem, ...]:
+    """Memoized dependency scan; tuple so cached results stay immutable."""
+    match = DEPS_SECTION_PATTERN.search(body)
+    if not match:
+        return ()
+
+    section_content = match.group(2) if match.group(2) else ""
+    return tuple(parse_task_items(section_content))
+
+
 def parse_dependencies(body: str) -> list[TaskItem]:
     """Parse dependencies from issue body.
 
     Looks for a ## Dependencies section and extracts task list items.
+    The same body is often parsed several times per invocation (list
+    views, enrichment, tree walks), so results are memoized.
     """
-    match = DEPS_SECTION_PATTERN.search(body)
-    if not match:
+    # Fast path: a dependencies section (and its items) always contains
+    # "#", so plain-text bodies skip the regex scan entirely
+    if "#" not in body:
         return []
 
-    section_content = match.group(2) if match.group(2) else ""
-    return parse_task_items(section_content)
+    return list(_parse_dependencies_cached(body))
 
 
 def add_dependencies(
@@ -305,6 +319,59 @@ def find_all_task_items(content: str) -> list[GeneralTaskItem]:
     return items
 
 
+class TaskIndex:
+    """Index of task list items, computed in one pass over the content.
+
+    Toggling a checkbox rewrites the line with the same length, so item
+    positions stay valid across successive toggle operations — callers
+    applying several checks/unchecks to the same body only pay for a
+    single scan.
+    """
+
+    def __init__(self, content: str):
+        self.content = content
+        self.items = find_all_task_items(content)
+
+    def _apply(self, item: GeneralTaskItem, complete: bool) -> None:
+        new_line = f"- [{'x' if complete else ' '}] {item.text}"
+        self.content = (
+            self.content[: item.start_pos] + new_line + self.content[item.end_pos :]
+        )
+        item.complete = complete
+
+    def toggle_by_text(
+        self,
+        pattern: str,
+        complete: bool,
+        case_sensitive: bool = False,
+    ) -> list[GeneralTaskItem]:
+        """Toggle task items matching a text pattern (substring match)."""
+        search_pattern = pattern if case_sensitive else pattern.lower()
+
+        toggled = []
+        for item in self.items:
+            item_text = item.text if case_sensitive else item.text.lower()
+            if search_pattern in item_text:
+                toggled.append(item)
+
+        for item in toggled:
+            self._apply(item, complete)
+
+        return toggled
+
+    def toggle_at_line(
+        self,
+        line_number: int,
+        complete: bool,
+    ) -> GeneralTaskItem | None:
+        """Toggle the task item at a 1-indexed line number, if any."""
+        for item in self.items:
+            if item.line_number == line_number:
+                self._apply(item, complete)
+                return item
+        return None
+
+
 def toggle_task_by_text(
     content: str,
     pattern: str,
@@ -322,30 +389,11 @@ def toggle_task_by_text(
     Returns:
         Tuple of (updated content, list of toggled items)
     """
-    items = find_all_task_items(content)
-    toggled = []
-
-    search_pattern = pattern if case_sensitive else pattern.lower()
-
-    for item in items:
-        item_text = item.text if case_sensitive else item.text.lower()
-        if search_pattern in item_text:
-            toggled.append(item)
-
+    index = TaskIndex(content)
+    toggled = index.toggle_by_text(pattern, complete, case_sensitive)
     if not toggled:
         return content, []
-
-    # Apply changes from end to start to preserve positions
-    result = content
-    for item in reversed(toggled):
-        new_line = f"- [{'x' if complete else ' '}] {item.text}"
-        result = result[: item.start_pos] + new_line + result[item.end_pos :]
-
-    # Update the toggled items with new state
-    for item in toggled:
-        item.complete = complete
-
-    return result, toggled
+    return index.content, toggled
 
 
 def toggle_task_at_line(
@@ -363,16 +411,11 @@ def toggle_task_at_line(
     Returns:
         Tuple of (updated content, toggled item or None if not found)
     """
-    items = find_all_task_items(content)
-
-    for item in items:
-        if item.line_number == line_number:
-            new_line = f"- [{'x' if complete else ' '}] {item.text}"
-            result = content[: item.start_pos] + new_line + content[item.end_pos :]
-            item.complete = complete
-            return result, item
-
-    return content, None
+    index = TaskIndex(content)
+    item = index.toggle_at_line(line_number, complete)
+    if item is None:
+        return content, None
+    return index.content, item
 
 
 @dataclass
@@ -398,6 +441,11 @@ def find_section(content: str, header: str) -> Section | None:
     Returns:
         Section object or None if not found
     """
+    # Fast path: if the header text never appears, skip the regex walk
+    # (headers match case-insensitively, so compare lowercased)
+    if header.lower() not in content.lower():
+        return None
+
     for match in SECTION_PATTERN.finditer(content):
         hashes, header_text, section_content = match.groups()
         if header_text.strip().lower() == header.lower():
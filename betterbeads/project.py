@@ -1,5 +1,6 @@
 """Project status management helpers."""
 
+import json
 from dataclasses import dataclass
 from typing import Any
 
@@ -32,29 +33,65 @@ class ProjectResolver:
 
     def __init__(self, client: GhClient):
         self.client = client
-        self._project_cache: dict[str, dict[str, Any]] = {}
-        self._field_cache: dict[int, list[dict[str, Any]]] = {}
+        self._project_cache: dict[str, list[dict[str, Any]]] = {}
+        self._field_cache: dict[tuple[int, str], list[dict[str, Any]]] = {}
+        self._info_cache: dict[tuple[str, int, str, str | None], ProjectInfo | None] = {}
+
+    def _list_projects(self, owner: str) -> list[dict[str, Any]]:
+        """List an owner's projects, cached per resolver."""
+        if owner not in self._project_cache:
+            self._project_cache[owner] = self.client.project_list(owner)
+        return self._project_cache[owner]
+
+    def _list_fields(self, project_number: int, owner: str) -> list[dict[str, Any]]:
+        """List a project's fields, cached per resolver."""
+        key = (project_number, owner)
+        if key not in self._field_cache:
+            self._field_cache[key] = self.client.project_field_list(project_number, owner)
+        return self._field_cache[key]
 
     def get_project_info_for_issue(
         self,
         issue_number: int,
         repo: str,
         project_title: str | None = None,
+        issue_data: dict[str, Any] | None = None,
     ) -> ProjectInfo | None:
         """Get project info for an issue.
 
+        Results are memoized per resolver, so repeated lookups for the
+        same issue (status plus several field updates) resolve once.
+
         Args:
             issue_number: The issue number
             repo: The repo in owner/repo format
             project_title: Optional project title to filter by
+            issue_data: Already-fetched issue view data, to skip the
+                internal issue_view call
 
         Returns:
             ProjectInfo if found, None otherwise
         """
+        cache_key = ("issue", issue_number, repo, project_title)
+        if cache_key in self._info_cache:
+            return self._info_cache[cache_key]
+
+        info = self._resolve_info_for_issue(issue_number, repo, project_title, issue_data)
+        self._info_cache[cache_key] = info
+        return info
+
+    def _resolve_info_for_issue(
+        self,
+        issue_number: int,
+        repo: str,
+        project_title: str | None,
+        issue_data: dict[str, Any] | None = None,
+    ) -> ProjectInfo | None:
         owner = repo.split("/")[0]
 
         # Get issue's project items
-        issue_data = self.client.issue_view(issue_number, repo=repo)
+        if issue_data is None:
+            issue_data = self.client.issue_view(issue_number, repo=repo)
         project_items = issue_data.get("projectItems", [])
 
         if not project_items:
@@ -74,7 +111,7 @@ class ProjectResolver:
         project_title_found = target_project.get("title") or target_project.get("project", {}).get("title", "")
 
         # Find project number by listing projects
-        projects = self.client.project_list(owner)
+        projects = self._list_projects(owner)
         project_data = None
         for proj in projects:
             if proj.get("title") == project_title_found:
@@ -115,12 +152,17 @@ class ProjectResolver:
         pr_number: int,
         repo: str,
         project_title: str | None = None,
+        pr_data: dict[str, Any] | None = None,
     ) -> ProjectInfo | None:
-        """Get project info for a PR. Same logic as issues."""
+        """Get project info for a PR. Same logic as issues.
+
+        Pass pr_data from an earlier pr_view to skip the internal fetch.
+        """
         owner = repo.split("/")[0]
 
         # Get PR's project items
-        pr_data = self.client.pr_view(pr_number, repo=repo)
+        if pr_data is None:
+            pr_data = self.client.pr_view(pr_number, repo=repo)
         project_items = pr_data.get("projectItems", [])
 
         if not project_items:
@@ -140,7 +182,7 @@ class ProjectResolver:
         project_title_found = target_project.get("title") or target_project.get("project", {}).get("title", "")
 
         # Find project number by listing projects
-        projects = self.client.project_list(owner)
+        projects = self._list_projects(owner)
         project_data = None
         for proj in projects:
             if proj.get("title") == project_title_found:
@@ -178,7 +220,7 @@ class ProjectResolver:
 
     def get_status_field(self, project_number: int, owner: str) -> FieldInfo | None:
         """Get the Status field info for a project."""
-        fields = self.client.project_field_list(project_number, owner)
+        fields = self._list_fields(project_number, owner)
 
         for field in fields:
             if field.get("name") == "Status":
@@ -193,7 +235,7 @@ class ProjectResolver:
 
     def get_field_by_name(self, project_number: int, owner: str, field_name: str) -> FieldInfo | None:
         """Get a field by name."""
-        fields = self.client.project_field_list(project_number, owner)
+        fields = self._list_fields(project_number, owner)
 
         for field in fields:
             if field.get("name") == field_name:
@@ -254,6 +296,67 @@ class ProjectResolver:
             single_select_option_id=option_id,
         )
 
+    def _field_value_expr(self, field: FieldInfo, value: str) -> str:
+        """Build the GraphQL value expression for a field update.
+
+        Resolves single-select option IDs the same way set_field does;
+        other field types are set as text.
+
+        Raises:
+            GhError: If a single-select value is invalid
+        """
+        if field.field_type == "ProjectV2SingleSelectField":
+            value_lower = value.lower()
+            for option in (field.options or []):
+                if option.get("name", "").lower() == value_lower:
+                    return f"{{ singleSelectOptionId: {json.dumps(option.get('id'))} }}"
+
+            available = [opt.get("name") for opt in (field.options or [])]
+            raise GhError(
+                f"Value '{value}' not valid for field '{field.name}'. Available: {', '.join(available)}"
+            )
+        return f"{{ text: {json.dumps(value)} }}"
+
+    def set_fields_batch(
+        self,
+        project_info: ProjectInfo,
+        fields: dict[str, str],
+    ) -> dict[str, Any]:
+        """Set several field values on a project item in one API call.
+
+        Builds a single GraphQL document with one aliased
+        updateProjectV2ItemFieldValue mutation per field, so N updates
+        cost one round trip instead of N.
+
+        Args:
+            project_info: The project and item info
+            fields: Mapping of field name to value (may include "Status")
+
+        Returns:
+            The parsed GraphQL response
+
+        Raises:
+            GhError: If a field is not found or a value is invalid
+        """
+        mutations = []
+        for i, (field_name, value) in enumerate(fields.items()):
+            field = self.get_field_by_name(project_info.project_number, project_info.owner, field_name)
+            if not field:
+                raise GhError(f"Field '{field_name}' not found in project '{project_info.project_title}'")
+
+            mutations.append(
+                f"m{i}: updateProjectV2ItemFieldValue(input: {{"
+                f"projectId: {json.dumps(project_info.project_id)}, "
+                f"itemId: {json.dumps(project_info.item_id)}, "
+                f"fieldId: {json.dumps(field.field_id)}, "
+                f"value: {self._field_value_expr(field, value)}"
+                f"}}) {{ projectV2Item {{ id }} }}"
+            )
+
+        document = "mutation {\n" + "\n".join(mutations) + "\n}"
+        result = self.client.run(["api", "graphql", "-f", f"query={document}"])
+        return result.json()
+
     def set_field(
         self,
         project_info: ProjectInfo,